@@ -2,118 +2,75 @@ from flask import Flask, jsonify, request, send_from_directory
 from flask_cors import CORS
 import os
 
+# Shared recommendation engine (same instance as the ML API), loaded in the background
+from engine import engine_status, is_ready, recommender as engine, start_engine
+from ml_model import SCORERS
+from responses import CatalogResponses, parse_page
+
 app = Flask(__name__)
 CORS(app)
 
-# Sample career data
-CAREER_DATA = [
-    {
-        "id": 1,
-        "title": "Data Scientist",
-        "category": "Technology",
-        "description": "Analyze complex data using machine learning and statistics to help organizations make better decisions.",
-        "required_skills": ["python", "machine learning", "sql", "statistics", "data analysis"],
-        "average_salary": "$120,000 - $160,000",
-        "growth_rate": "22%",
-        "experience_needed": "3-5 years",
-        "education": "Master's in Computer Science/Statistics",
-        "match_score": 0
-    },
-    {
-        "id": 2,
-        "title": "Machine Learning Engineer",
-        "category": "Technology",
-        "description": "Design, build, and deploy machine learning models for production systems.",
-        "required_skills": ["python", "deep learning", "tensorflow", "aws", "docker"],
-        "average_salary": "$140,000 - $180,000",
-        "growth_rate": "28%",
-        "experience_needed": "4-6 years",
-        "education": "Bachelor's/Master's in Computer Science",
-        "match_score": 0
-    },
-    {
-        "id": 3,
-        "title": "Frontend Developer",
-        "category": "Technology",
-        "description": "Build responsive and interactive user interfaces for web applications.",
-        "required_skills": ["javascript", "react", "css", "html", "typescript"],
-        "average_salary": "$85,000 - $130,000",
-        "growth_rate": "13%",
-        "experience_needed": "2-4 years",
-        "education": "Bachelor's in Computer Science",
-        "match_score": 0
-    },
-    {
-        "id": 4,
-        "title": "Backend Developer",
-        "category": "Technology",
-        "description": "Develop server-side logic, databases, and APIs for web applications.",
-        "required_skills": ["python", "java", "node.js", "sql", "mongodb"],
-        "average_salary": "$95,000 - $140,000",
-        "growth_rate": "15%",
-        "experience_needed": "3-5 years",
-        "education": "Bachelor's in Computer Science",
-        "match_score": 0
-    },
-    {
-        "id": 5,
-        "title": "DevOps Engineer",
-        "category": "Technology",
-        "description": "Automate and streamline software deployment and infrastructure management.",
-        "required_skills": ["docker", "kubernetes", "aws", "linux", "python"],
-        "average_salary": "$110,000 - $150,000",
-        "growth_rate": "21%",
-        "experience_needed": "3-5 years",
-        "education": "Bachelor's in Computer Science",
-        "match_score": 0
-    }
-]
+# Catalog endpoint bodies, rendered once per catalog
+catalog_responses = CatalogResponses(engine)
 
-def calculate_match_score(user_skills, career, experience_years):
-    """Simple match score calculation"""
-    user_skills_set = set([s.lower().strip() for s in user_skills.split(',')])
-    career_skills_set = set([s.lower() for s in career["required_skills"]])
-    
-    # Calculate skill match
-    common_skills = len(user_skills_set.intersection(career_skills_set))
-    skill_match = (common_skills / len(career_skills_set)) * 70
-    
-    # Experience adjustment
-    exp_needed = int(career["experience_needed"].split('-')[0].split()[0])
-    exp_adjustment = min(experience_years / exp_needed, 1.5) * 30
+# This app has always ranked by skill overlap; other scorers are opt-in per request
+DEFAULT_SCORER = 'overlap'
+
+# Endpoints served while the model is still loading
+UNGATED_ENDPOINTS = {'health', 'ready', 'serve_index', 'serve_frontend', 'static'}
+
+@app.before_request
+def require_engine():
+    start_engine()
+    if request.endpoint in UNGATED_ENDPOINTS or is_ready():
+        return None
     
-    return min(skill_match + exp_adjustment, 99.9)
+    status = engine_status()
+    message = 'Recommender failed to load' if status['state'] == 'failed' else 'Recommender is loading, retry shortly'
+    return jsonify({'error': message, 'model': status}), 503, {'Retry-After': '1'}
 
 @app.route('/api/health', methods=['GET'])
 def health():
-    return jsonify({'status': 'healthy', 'message': 'Career API Running'})
+    return jsonify({'status': 'healthy', 'message': 'Career API Running', 'model': engine_status()})
+
+@app.route('/api/ready', methods=['GET'])
+def ready():
+    status = engine_status()
+    if status['state'] != 'ready':
+        return jsonify({'status': status['state'], 'model': status}), 503, {'Retry-After': '1'}
+    
+    return jsonify({'status': 'ready', 'model': status})
 
 @app.route('/api/recommend', methods=['POST'])
 def recommend():
     data = request.json
     
-    user_skills = data.get('skills', '')
-    user_interests = data.get('interests', '')
-    experience_years = int(data.get('experience_years', 2))
-    
-    # Calculate scores for all careers
-    for career in CAREER_DATA:
-        career["match_score"] = round(calculate_match_score(user_skills, career, experience_years), 1)
+    scorer = data.get('scorer') or DEFAULT_SCORER
+    if scorer not in SCORERS:
+        return jsonify({'error': f'Unknown scorer, expected one of {sorted(SCORERS)}'}), 400
     
-    # Sort by match score
-    sorted_careers = sorted(CAREER_DATA, key=lambda x: x["match_score"], reverse=True)
+    recommendations = engine.recommend_careers(
+        user_skills=data.get('skills', ''),
+        user_interests=data.get('interests', ''),
+        experience_years=int(data.get('experience_years', 2)),
+        education_level=data.get('education_level', "Bachelor's"),
+        top_k=3,
+        scorer=scorer
+    )
     
     return jsonify({
         'status': 'success',
-        'recommendations': sorted_careers[:3]
+        'recommendations': [r.to_dict() for r in recommendations]
     })
 
 @app.route('/api/careers', methods=['GET'])
 def get_careers():
-    return jsonify({
-        'status': 'success',
-        'careers': CAREER_DATA
-    })
+    try:
+        offset, limit = parse_page(request.args)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    
+    return catalog_responses.careers('full', offset, limit).respond(request)
 
 # Serve frontend
 @app.route('/')
@@ -138,5 +95,9 @@ if __name__ == '__main__':
     print("\n🌐 Open your browser to: http://localhost:5000")
     print("=" * 60)
     
+    # Start loading the model while the development server starts, not on the first request;
+    # the reloader's watcher process never serves, so only the process it spawns loads
+    if os.environ.get('WERKZEUG_RUN_MAIN') == 'true':
+        start_engine()
     app.run(debug=True, port=5000)
     application = app
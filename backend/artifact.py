@@ -0,0 +1,92 @@
+"""Versioned, memory-mappable artifact of a fitted CareerRecommender
+
+An artifact directory holds the TF-IDF vocabulary, the IDF weights, the sparse
+TF-IDF matrix and the raw term counts as .npy arrays, plus the fingerprint of
+the catalog it was fitted on. Workers load it with every array memory-mapped instead of
+refitting the vectorizer, and refit only when the catalog has changed.
+
+Build one from the backend directory with:
+
+    python -m artifact data/careers.catalog data/careers.model
+"""
+import argparse
+import json
+import os
+from typing import Any, Dict, Optional
+
+import numpy as np
+from scipy.sparse import csr_matrix
+
+ARTIFACT_FORMAT_VERSION = 2
+
+# Sparse matrices stored as raw CSR arrays; term counts allow incremental catalog updates
+MATRICES = ["tfidf_matrix", "term_counts"]
+MATRIX_ARRAYS = ["data", "indices", "indptr"]
+
+
+def save_artifact(state, path: str):
+    """Write the fitted vectorizer, TF-IDF matrix and term counts of a model state"""
+    os.makedirs(path, exist_ok=True)
+    meta_path = os.path.join(path, "meta.json")
+    if os.path.exists(meta_path):
+        os.remove(meta_path)
+
+    vectorizer = state.vectorizer
+    vocabulary = sorted(vectorizer.vocabulary_, key=vectorizer.vocabulary_.get)
+
+    np.save(os.path.join(path, "idf.npy"), vectorizer.idf_)
+    for matrix_name in MATRICES:
+        matrix = getattr(state, matrix_name).tocsr()
+        for name in MATRIX_ARRAYS:
+            np.save(os.path.join(path, f"{matrix_name}_{name}.npy"), getattr(matrix, name))
+
+    # meta.json is written last so a partially written artifact is never considered valid
+    with open(meta_path, "w", encoding="utf-8") as f:
+        json.dump({
+            "format_version": ARTIFACT_FORMAT_VERSION,
+            "catalog_fingerprint": state.catalog.fingerprint,
+            "vectorizer": {"stop_words": vectorizer.stop_words, "max_features": vectorizer.max_features},
+            "shape": list(state.tfidf_matrix.shape),
+            "vocabulary": vocabulary
+        }, f, ensure_ascii=False)
+
+
+def load_artifact(path: str, catalog, vectorizer_params: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Vocabulary, IDF weights and memory-mapped matrices; None when the artifact does not match"""
+    try:
+        with open(os.path.join(path, "meta.json"), encoding="utf-8") as f:
+            meta = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    if (meta.get("format_version") != ARTIFACT_FORMAT_VERSION
+            or meta.get("vectorizer") != vectorizer_params
+            or meta.get("catalog_fingerprint") != catalog.fingerprint):
+        return None
+
+    loaded = {
+        "vocabulary": {term: i for i, term in enumerate(meta["vocabulary"])},
+        "idf": np.load(os.path.join(path, "idf.npy")),
+    }
+    for matrix_name in MATRICES:
+        arrays = [np.load(os.path.join(path, f"{matrix_name}_{name}.npy"), mmap_mode="r") for name in MATRIX_ARRAYS]
+        loaded[matrix_name] = csr_matrix(tuple(arrays), shape=tuple(meta["shape"]))
+    return loaded
+
+
+def main():
+    from catalog import load_catalog
+    from ml_model import CareerRecommender
+
+    parser = argparse.ArgumentParser(description="Fit the recommender on a catalog and save its artifact")
+    parser.add_argument("catalog", help="JSON career list or catalog directory")
+    parser.add_argument("output", help="artifact directory to write")
+    args = parser.parse_args()
+
+    recommender = CareerRecommender(load_catalog(args.catalog), model_path="")
+    recommender.save_artifact(args.output)
+    print(f"Wrote model artifact for {len(recommender.catalog)} careers to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
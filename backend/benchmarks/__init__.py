@@ -0,0 +1 @@
+"""Benchmarks for the career recommendation engine"""
@@ -0,0 +1,173 @@
+"""Import time of the app entry points, and how soon a server is live and ready
+
+Run from the backend directory:
+
+    python -m benchmarks.bench_import --max-import-ms 1000 --careers 60000 --max-live-s 3
+
+Each entry point is imported in a fresh interpreter with python -X importtime,
+best of --repeat runs, and the report lists where the time goes by top-level
+package. The apps load the model on a background thread, so importing one must
+not pull in scikit-learn, pandas or joblib; any of --forbid that shows up is a
+failure, whatever the timings.
+
+Unless --skip-server is given, gunicorn then serves app:app the way it is
+deployed, with gunicorn.conf.py and its preloading master (--no-preload
+loads in every worker instead), over the bundled catalog or a generated one
+of --careers careers. The report times how long after launch GET /api/health
+first answers (live) and GET /api/ready first answers 200 (ready). Live
+should not wait for the model.
+
+Exits 1 when a check fails, so CI can catch a heavy import creeping back.
+"""
+import argparse
+import json
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.error
+import urllib.request
+from typing import Dict, List, Optional, Tuple
+
+from benchmarks.generators import generate_careers
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+ENTRY_POINTS = ["app", "routes.app", "routes.asgi"]
+
+# Only needed once the model is fitted or an artifact is saved or loaded
+FORBIDDEN = ["sklearn", "pandas", "joblib"]
+
+
+def import_profile(module: str) -> Tuple[float, Dict[str, Tuple[int, int]]]:
+    """Cumulative import time of a module in ms, and every imported module's (self, cumulative) time in us"""
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                            cwd=BACKEND_DIR, capture_output=True, text=True, check=True)
+    modules = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:"):].split("|")
+        try:
+            modules[fields[2].strip()] = (int(fields[0]), int(fields[1]))
+        except ValueError:
+            continue  # the header line
+    return modules[module][1] / 1000, modules
+
+
+def by_package(modules: Dict[str, Tuple[int, int]]) -> List[Tuple[str, float]]:
+    """Self import time summed per top-level package, in ms, slowest first"""
+    totals: Dict[str, float] = {}
+    for name, (self_us, _) in modules.items():
+        package = name.split(".")[0]
+        totals[package] = totals.get(package, 0.0) + self_us / 1000
+    return sorted(totals.items(), key=lambda item: -item[1])
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def responds(url: str) -> Optional[int]:
+    """Status code of a GET, or None when nothing answers yet"""
+    try:
+        with urllib.request.urlopen(url, timeout=5) as response:
+            return response.status
+    except urllib.error.HTTPError as e:
+        return e.code
+    except OSError:
+        return None
+
+
+def server_startup(workers: int, preload: bool, n_careers: int, timeout: float) -> Tuple[float, float]:
+    """Seconds from launching gunicorn until /api/health answers and until /api/ready answers 200"""
+    with tempfile.TemporaryDirectory() as tmp:
+        config_path = os.path.join(BACKEND_DIR, "gunicorn.conf.py")
+        if not preload:
+            config_path = os.path.join(tmp, "gunicorn_conf.py")
+            with open(config_path, "w") as f:
+                f.write(f"import runpy\nglobals().update(runpy.run_path({os.path.join(BACKEND_DIR, 'gunicorn.conf.py')!r}))\n"
+                        "preload_app = False\n")
+
+        env = dict(os.environ)
+        if n_careers:
+            catalog_path = os.path.join(tmp, "careers.json")
+            with open(catalog_path, "w", encoding="utf-8") as f:
+                json.dump(generate_careers(n_careers), f)
+            env.update(CAREER_CATALOG_PATH=catalog_path, CAREER_MODEL_ARTIFACT="", CAREER_TOPK_TABLE="")
+
+        port = free_port()
+        base = f"http://127.0.0.1:{port}"
+        start = time.perf_counter()
+        server = subprocess.Popen(
+            [sys.executable, "-m", "gunicorn", "app:app", "-c", config_path, "--workers", str(workers),
+             "--bind", f"127.0.0.1:{port}"],
+            cwd=BACKEND_DIR, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE
+        )
+        try:
+            live = ready = None
+            while ready is None:
+                if server.poll() is not None:
+                    raise RuntimeError(f"gunicorn exited: {server.stderr.read().decode(errors='replace')}")
+                if time.perf_counter() - start > timeout:
+                    raise RuntimeError(f"server not ready after {timeout} s")
+                if live is None and responds(f"{base}/api/health") == 200:
+                    live = time.perf_counter() - start
+                if live is not None and responds(f"{base}/api/ready") == 200:
+                    ready = time.perf_counter() - start
+                time.sleep(0.01)
+        finally:
+            server.terminate()
+            server.wait(timeout=60)
+    return live, ready
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--modules", nargs="+", default=ENTRY_POINTS)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--top", type=int, default=8, help="packages listed per entry point")
+    parser.add_argument("--forbid", nargs="*", default=FORBIDDEN, help="packages no entry point may import")
+    parser.add_argument("--max-import-ms", type=float, help="fail when an entry point takes longer to import")
+    parser.add_argument("--max-live-s", type=float, help="fail when /api/health takes longer to answer")
+    parser.add_argument("--skip-server", action="store_true")
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument("--no-preload", action="store_true", help="load the model in every worker")
+    parser.add_argument("--careers", type=int, default=0, help="serve a generated catalog of this size")
+    parser.add_argument("--timeout", type=float, default=300)
+    args = parser.parse_args()
+
+    failures = []
+    for module in args.modules:
+        runs = [import_profile(module) for _ in range(args.repeat)]
+        import_ms, modules = min(runs, key=lambda run: run[0])
+
+        print(f"import {module}: {import_ms:8.1f} ms")
+        for package, ms in by_package(modules)[:args.top]:
+            print(f"    {package:<28} {ms:8.1f} ms")
+
+        forbidden = sorted({name.split(".")[0] for name in modules} & set(args.forbid))
+        if forbidden:
+            failures.append(f"import {module} pulls in {', '.join(forbidden)}")
+        if args.max_import_ms is not None and import_ms > args.max_import_ms:
+            failures.append(f"import {module} took {import_ms:.1f} ms, budget {args.max_import_ms:.1f} ms")
+
+    if not args.skip_server:
+        live, ready = server_startup(args.workers, not args.no_preload, args.careers, args.timeout)
+        mode = "per-worker" if args.no_preload else "preload"
+        print(f"gunicorn app:app ({mode}, {args.workers} workers) live after  {live:8.3f} s")
+        print(f"gunicorn app:app ({mode}, {args.workers} workers) ready after {ready:8.3f} s")
+        if args.max_live_s is not None and live > args.max_live_s:
+            failures.append(f"/api/health answered after {live:.3f} s, budget {args.max_live_s:.3f} s")
+
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
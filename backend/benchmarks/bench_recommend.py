@@ -0,0 +1,60 @@
+"""Per-request latency of recommend_careers before and after compiling the catalog
+
+Run from the backend directory:
+
+    python -m benchmarks.bench_recommend
+"""
+import argparse
+import time
+from typing import List, Dict
+
+from sklearn.metrics.pairwise import cosine_similarity
+
+from ml_model import CareerRecommender
+from benchmarks.generators import generate_careers, generate_profiles
+
+
+def legacy_recommend(recommender: CareerRecommender, user_skills: str, user_interests: str,
+                     experience_years: int = 2, education_level: str = "Bachelor's") -> List[Dict]:
+    """The per-career Python loop recommend_careers used before the catalog was compiled"""
+    user_vector = recommender.vectorizer.transform([user_skills.lower() + " " + user_interests.lower()])
+    similarities = cosine_similarity(user_vector, recommender.tfidf_matrix).flatten()
+    
+    scored = []
+    for i, career in enumerate(recommender.career_data):
+        min_exp = int(career["experience_needed"].split("-")[0].split()[0])
+        exp_adjustment = min(experience_years / min_exp, 1.5) * 20
+        education_match = 1.0 if education_level in career["education"] else 0.8
+        score = min(round(similarities[i] * 100 * education_match + exp_adjustment, 2), 99.9)
+        scored.append(dict(career, match_score=score))
+    
+    return sorted(scored, key=lambda x: x["match_score"], reverse=True)[:5]
+
+
+def time_per_request(fn, profiles: List[Dict]) -> float:
+    """Mean latency in milliseconds of fn over the given profiles"""
+    fn(profiles[0]["skills"], profiles[0]["interests"])  # warm up
+    start = time.perf_counter()
+    for p in profiles:
+        fn(p["skills"], p["interests"], p["experience_years"], p["education_level"])
+    return (time.perf_counter() - start) / len(profiles) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[8, 1000, 100000])
+    parser.add_argument("--requests", type=int, default=50)
+    args = parser.parse_args()
+    
+    print(f"{'careers':>8}  {'before (ms)':>12}  {'after (ms)':>11}  {'speedup':>8}")
+    for size in args.sizes:
+        recommender = CareerRecommender(generate_careers(size), cache_size=0)
+        profiles = generate_profiles(args.requests)
+        
+        before = time_per_request(lambda *a: legacy_recommend(recommender, *a), profiles)
+        after = time_per_request(recommender.recommend_careers, profiles)
+        print(f"{size:>8}  {before:>12.3f}  {after:>11.3f}  {before / after:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""Recall@5 and latency of IVF candidate retrieval against exact search
+
+Run from the backend directory:
+
+    python -m benchmarks.bench_retrieval --careers 100000 --probes 1 2 4 8 16 32
+"""
+import argparse
+import time
+
+from catalog import CareerCatalog
+from ml_model import CareerRecommender, ExactRetriever, IVFRetriever
+from benchmarks.generators import generate_careers, generate_profiles
+
+
+def run(recommender: CareerRecommender, profiles) -> tuple:
+    """Top-5 ids per profile and mean latency in milliseconds"""
+    results = []
+    start = time.perf_counter()
+    for p in profiles:
+        results.append([r.career_id for r in recommender.recommend_careers(
+            p["skills"], p["interests"], p["experience_years"], p["education_level"])])
+    return results, (time.perf_counter() - start) / len(profiles) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--careers", type=int, default=100000)
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--probes", type=int, nargs="+", default=[1, 4, 16, 64])
+    args = parser.parse_args()
+    
+    catalog = CareerCatalog.from_records(generate_careers(args.careers))
+    profiles = generate_profiles(args.requests, seed=1)
+    
+    exact = CareerRecommender(catalog, cache_size=0, model_path="", retriever=ExactRetriever())
+    expected, exact_ms = run(exact, profiles)
+    
+    start = time.perf_counter()
+    ivf = CareerRecommender(catalog, cache_size=0, model_path="", retriever=IVFRetriever(min_catalog_size=0))
+    fit_seconds = time.perf_counter() - start
+    
+    print(f"careers: {args.careers}, IVF partitions: {len(ivf.state.retriever_index[1])}, fit: {fit_seconds:.1f} s")
+    print(f"{'retriever':>12}  {'recall@5':>8}  {'latency (ms)':>12}")
+    print(f"{'exact':>12}  {1:>8.3f}  {exact_ms:>12.3f}")
+    for n_probe in args.probes:
+        ivf.retriever.n_probe = n_probe
+        got, ivf_ms = run(ivf, profiles)
+        recall = sum(len(set(g) & set(e)) for g, e in zip(got, expected)) / sum(len(e) for e in expected)
+        print(f"{f'ivf/{n_probe}':>12}  {recall:>8.3f}  {ivf_ms:>12.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""Worker startup time: refitting the vectorizer vs loading a saved model artifact
+
+Run from the backend directory:
+
+    python -m benchmarks.bench_startup --careers 100000
+
+Each measurement boots a fresh interpreter, the way a gunicorn worker does, and
+constructs CareerRecommender from a memory-mapped catalog.
+"""
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+from catalog import CareerCatalog
+from ml_model import CareerRecommender
+from benchmarks.generators import generate_careers
+
+BOOT = "from ml_model import CareerRecommender; CareerRecommender()"
+IMPORT_ONLY = "import ml_model"
+
+
+def boot_seconds(env: dict, repeat: int, code: str = BOOT) -> float:
+    """Best wall time of starting a worker and constructing the recommender"""
+    backend_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", code], cwd=backend_dir, env=env, check=True)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--careers", type=int, default=100000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        catalog_path = os.path.join(tmp, "careers.catalog")
+        model_path = os.path.join(tmp, "careers.model")
+        CareerCatalog.from_records(generate_careers(args.careers)).save(catalog_path)
+        CareerRecommender(CareerCatalog.open(catalog_path), model_path="").save_artifact(model_path)
+        
+        env = dict(os.environ, CAREER_CATALOG_PATH=catalog_path, CAREER_MODEL_ARTIFACT="")
+        imports = boot_seconds(env, args.repeat, IMPORT_ONLY)
+        refit = boot_seconds(env, args.repeat)
+        loaded = boot_seconds(dict(env, CAREER_MODEL_ARTIFACT=model_path), args.repeat)
+    
+    print(f"careers: {args.careers}")
+    print(f"imports only:    {imports:8.3f} s")
+    print(f"refit on boot:   {refit:8.3f} s")
+    print(f"load artifact:   {loaded:8.3f} s  ({refit / loaded:.1f}x faster)")
+
+
+if __name__ == "__main__":
+    main()
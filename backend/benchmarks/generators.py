@@ -0,0 +1,104 @@
+import random
+from typing import List, Dict
+
+from catalog import EDUCATION_LEVELS
+
+CATEGORIES = ["Technology", "Business & Analytics", "Security", "Cloud & Infrastructure", "Design", "Healthcare"]
+FIELDS = ["Computer Science", "Statistics", "Mathematics", "Business", "IT", "Cybersecurity"]
+WORDS = [
+    "analyze", "build", "design", "deploy", "data", "systems", "models", "platform", "secure", "scale",
+    "customers", "reports", "pipelines", "services", "networks", "applications", "teams", "research",
+]
+
+
+# Skills come in families of this size so careers and profiles cluster like real roles do
+FAMILY_SIZE = 50
+
+
+# Domain words per family, so descriptions and interests cluster along with skills
+DOMAIN_WORDS = 20
+
+
+def pick_family(rng: random.Random, skills: List[str]) -> int:
+    """Index of a random skill family"""
+    return rng.randrange(max(len(skills) // FAMILY_SIZE, 1))
+
+
+def draw_skills(rng: random.Random, skills: List[str], family: int, k: int, noise: float = 0.2) -> List[str]:
+    """Mostly skills from one family, with some drawn from the whole vocabulary"""
+    members = skills[family * FAMILY_SIZE:(family + 1) * FAMILY_SIZE]
+    drawn = {rng.choice(skills) if rng.random() < noise else rng.choice(members) for _ in range(k)}
+    return sorted(drawn)
+
+
+def draw_words(rng: random.Random, family: int, k: int) -> List[str]:
+    """Domain words of a family mixed with generic ones"""
+    return [f"domain{family}x{rng.randrange(DOMAIN_WORDS)}" if rng.random() < 0.7 else rng.choice(WORDS)
+            for _ in range(k)]
+
+
+def generate_careers(n_careers: int, n_skills: int = 2000, seed: int = 0) -> List[Dict]:
+    """Generate a synthetic career catalog with the same shape as the built-in one"""
+    rng = random.Random(seed)
+    skills = [f"skill{i}" for i in range(n_skills)]
+    careers = []
+    
+    for i in range(n_careers):
+        min_exp = rng.randint(1, 6)
+        family = pick_family(rng, skills)
+        required_skills = draw_skills(rng, skills, family, rng.randint(4, 8))
+        careers.append({
+            "id": i + 1,
+            "title": f"Career {i + 1}",
+            "category": rng.choice(CATEGORIES),
+            "description": " ".join(draw_words(rng, family, 12)) + ".",
+            "required_skills": required_skills,
+            "recommended_skills": sorted(set(rng.sample(skills, rng.randint(3, 6))) - set(required_skills)),
+            "average_salary": f"${rng.randint(50, 150)},000 - ${rng.randint(150, 250)},000",
+            "growth_rate": f"{rng.randint(1, 35)}%",
+            "experience_needed": f"{min_exp}-{min_exp + rng.randint(1, 3)} years",
+            "education": f"{rng.choice(EDUCATION_LEVELS[2:])} in {rng.choice(FIELDS)}",
+            "companies": [f"Company {rng.randint(1, 500)}" for _ in range(3)],
+            "learning_path": [f"Step {step}" for step in range(1, 6)],
+            "job_market": "Synthetic",
+            "match_score": 0
+        })
+    
+    return careers
+
+
+def generate_profiles(n_profiles: int, n_skills: int = 2000, skills_per_profile: int = 5, seed: int = 0) -> List[Dict]:
+    """Generate synthetic user profiles drawing from the same skill vocabulary"""
+    rng = random.Random(seed)
+    skills = [f"skill{i}" for i in range(n_skills)]
+    
+    profiles = []
+    
+    for _ in range(n_profiles):
+        family = pick_family(rng, skills)
+        profiles.append({
+            "skills": ", ".join(draw_skills(rng, skills, family, skills_per_profile)),
+            "interests": " ".join(draw_words(rng, family, 3)),
+            "experience_years": rng.randint(0, 10),
+            "education_level": rng.choice(EDUCATION_LEVELS)
+        })
+    
+    return profiles
+
+
+def generate_skill_graph(n_skills: int = 2000, seed: int = 0) -> Dict:
+    """Prerequisite graph over the synthetic skill vocabulary, mostly within skill families"""
+    rng = random.Random(seed)
+    skills = [f"skill{i}" for i in range(n_skills)]
+    graph = {}
+    
+    for i, skill in enumerate(skills):
+        # Prerequisites are earlier skills of the same family, plus sometimes the foundational first skill
+        # of another family; first skills require nothing, so the graph stays acyclic
+        family_start = i - i % FAMILY_SIZE
+        requires = set(rng.sample(skills[family_start:i], min(i - family_start, rng.randint(0, 3))))
+        if i > family_start and rng.random() < 0.2:
+            requires.add(skills[rng.randrange(max(n_skills // FAMILY_SIZE, 1)) * FAMILY_SIZE])
+        graph[skill] = {"effort_weeks": rng.randint(1, 8), "requires": sorted(requires - {skill})}
+    
+    return {"default_effort_weeks": 4, "skills": graph}
@@ -0,0 +1,178 @@
+"""Per-worker memory of the gunicorn deployment, with and without a preloaded model
+
+Run from the backend directory:
+
+    python -m benchmarks.memory_report --careers 100000 --workers 1 2 4
+
+For each worker count and mode, gunicorn serves app:app over a generated
+catalog. "per-worker" has every worker build its own recommender; "preload"
+uses gunicorn.conf.py, which builds it once in the master before forking.
+Once every worker has loaded the app and served some warm-up requests, the
+report reads /proc/<pid>/smaps_rollup of the master and each worker:
+
+    RSS   resident pages, counting shared pages in full
+    PSS   resident pages, with shared pages split between their users
+    USS   pages private to the process (Private_Clean + Private_Dirty)
+
+Total PSS (master plus workers) is what the deployment really costs. With
+preloading, a worker's USS is what each extra worker adds. Linux only.
+"""
+import argparse
+import json
+import os
+import random
+import signal
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+from typing import Dict, List
+
+from benchmarks.generators import generate_careers, generate_profiles
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Appended to the config of each run so the report knows when every worker has loaded the model
+READY_HOOK = """
+import os
+
+def post_worker_init(worker):
+    from engine import get_engine, is_ready
+    if not worker.cfg.preload_app:
+        get_engine()
+    # With preloading, workers forked before the model loaded are replaced by ones that have it
+    if is_ready():
+        open(os.path.join({ready_dir!r}, str(os.getpid())), "w").close()
+"""
+
+MODES = {
+    "per-worker": "preload_app = False\n",
+    "preload": f"import runpy\nglobals().update(runpy.run_path({os.path.join(BACKEND_DIR, 'gunicorn.conf.py')!r}))\n",
+}
+
+
+def memory_kb(pid: int) -> Dict[str, int]:
+    """RSS, PSS and USS of a process in kB"""
+    values = {}
+    with open(f"/proc/{pid}/smaps_rollup") as f:
+        for line in f:
+            parts = line.split()
+            if len(parts) == 3 and parts[2] == "kB":
+                values[parts[0].rstrip(":")] = int(parts[1])
+    return {
+        "rss": values.get("Rss", 0),
+        "pss": values.get("Pss", 0),
+        "uss": values.get("Private_Clean", 0) + values.get("Private_Dirty", 0),
+    }
+
+
+def children(pid: int) -> List[int]:
+    with open(f"/proc/{pid}/task/{pid}/children") as f:
+        return [int(child) for child in f.read().split()]
+
+
+def ready_workers(master_pid: int, ready_dir: str) -> List[int]:
+    """Live workers that have loaded the model"""
+    ready = {int(name) for name in os.listdir(ready_dir)}
+    return [pid for pid in children(master_pid) if pid in ready]
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def request(url: str, body: Dict = None):
+    data = json.dumps(body).encode("utf-8") if body is not None else None
+    req = urllib.request.Request(url, data=data, headers={"Content-Type": "application/json"})
+    with urllib.request.urlopen(req, timeout=60) as response:
+        response.read()
+
+
+def measure(mode: str, workers: int, catalog_path: str, n_careers: int, n_requests: int, timeout: float) -> Dict:
+    """Start gunicorn, warm it up and read the memory of its master and workers"""
+    with tempfile.TemporaryDirectory() as tmp:
+        ready_dir = os.path.join(tmp, "ready")
+        os.mkdir(ready_dir)
+        config_path = os.path.join(tmp, "gunicorn_conf.py")
+        with open(config_path, "w") as f:
+            f.write(MODES[mode] + READY_HOOK.format(ready_dir=ready_dir))
+
+        port = free_port()
+        env = dict(os.environ, CAREER_CATALOG_PATH=catalog_path, CAREER_MODEL_ARTIFACT="", CAREER_TOPK_TABLE="")
+        server = subprocess.Popen(
+            [sys.executable, "-m", "gunicorn", "app:app", "-c", config_path, "--workers", str(workers),
+             "--bind", f"127.0.0.1:{port}", "--timeout", str(int(timeout))],
+            cwd=BACKEND_DIR, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE
+        )
+        try:
+            deadline = time.monotonic() + timeout
+            while len(ready_workers(server.pid, ready_dir)) < workers:
+                if server.poll() is not None:
+                    raise RuntimeError(f"gunicorn exited: {server.stderr.read().decode(errors='replace')}")
+                if time.monotonic() > deadline:
+                    raise RuntimeError(f"{workers} workers not ready after {timeout} s")
+                time.sleep(0.2)
+
+            base = f"http://127.0.0.1:{port}"
+            rng = random.Random(0)
+            for profile in generate_profiles(n_requests):
+                request(f"{base}/api/recommend", profile)
+                request(f"{base}/api/careers?offset={rng.randrange(max(n_careers - 20, 1))}&limit=20")
+
+            master = memory_kb(server.pid)
+            worker_memory = [memory_kb(pid) for pid in ready_workers(server.pid, ready_dir)]
+        finally:
+            server.send_signal(signal.SIGTERM)
+            server.wait(timeout=60)
+
+    def mean(key: str) -> float:
+        return sum(m[key] for m in worker_memory) / len(worker_memory) / 1024
+
+    return {
+        "mode": mode,
+        "workers": workers,
+        "master_rss_mb": master["rss"] / 1024,
+        "worker_rss_mb": mean("rss"),
+        "worker_pss_mb": mean("pss"),
+        "worker_uss_mb": mean("uss"),
+        "total_pss_mb": (master["pss"] + sum(m["pss"] for m in worker_memory)) / 1024,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--careers", type=int, default=100000)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--modes", nargs="+", choices=list(MODES), default=list(MODES))
+    parser.add_argument("--requests", type=int, default=50, help="warm-up requests before measuring")
+    parser.add_argument("--timeout", type=float, default=600)
+    parser.add_argument("--output", help="write the results as JSON")
+    args = parser.parse_args()
+
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        catalog_path = os.path.join(tmp, "careers.json")
+        with open(catalog_path, "w", encoding="utf-8") as f:
+            json.dump(generate_careers(args.careers), f)
+
+        print(f"careers: {args.careers}")
+        print(f"{'mode':<11} {'workers':>7}  {'master RSS':>10} {'worker RSS':>10} {'worker PSS':>10} "
+              f"{'worker USS':>10} {'total PSS':>10}  (MB)")
+        for mode in args.modes:
+            for workers in args.workers:
+                r = measure(mode, workers, catalog_path, args.careers, args.requests, args.timeout)
+                results.append(r)
+                print(f"{mode:<11} {workers:>7}  {r['master_rss_mb']:>10.1f} {r['worker_rss_mb']:>10.1f} "
+                      f"{r['worker_pss_mb']:>10.1f} {r['worker_uss_mb']:>10.1f} {r['total_pss_mb']:>10.1f}")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({"careers": args.careers, "results": results}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
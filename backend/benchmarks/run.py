@@ -0,0 +1,263 @@
+"""Benchmark suite: fit, every scorer, skill gap and the Flask endpoints at several catalog sizes
+
+Run from the backend directory:
+
+    python -m benchmarks.run --careers 10 1000 100000 --output results.json
+    python -m benchmarks.run --baseline benchmarks/baseline.json
+
+Every catalog size runs in a fresh interpreter so its peak RSS is its own.
+Careers and profiles come from the seeded generators, so runs with the same
+arguments score the same data. Results are written as JSON. Throughput is
+calls per second and latencies are per call in milliseconds. With --baseline,
+each benchmark is compared against a stored result file, and the exit status
+is 1 when throughput drops or p95 latency rises by more than --tolerance.
+Catalogs of 1M careers work, given a few GB of memory for the generated
+records.
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+
+from benchmarks.generators import generate_careers, generate_profiles, generate_skill_graph
+
+BENCHMARKS = [
+    "fit", "recommend", "recommend_overlap", "recommend_hybrid", "recommend_batch", "skill_gap", "learning_plan",
+    "api_recommend", "api_skill_gap", "api_careers_page",
+]
+
+
+def peak_rss_mb() -> float:
+    """Peak resident set size of this process so far"""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in kilobytes on Linux and bytes on macOS
+    return peak / (1 << 20) if sys.platform == "darwin" else peak / 1024
+
+
+def summarize(name: str, n_careers: int, latencies: List[float], items_per_call: int = 1) -> Dict:
+    """Throughput, latency percentiles and peak RSS of timed calls"""
+    latencies_ms = np.array(latencies) * 1000
+    total = float(np.sum(latencies))
+    return {
+        "benchmark": name,
+        "careers": n_careers,
+        "calls": len(latencies),
+        "throughput_per_s": round(len(latencies) * items_per_call / total, 3) if total else None,
+        "latency_ms": {
+            "mean": round(float(latencies_ms.mean()), 4),
+            "p50": round(float(np.percentile(latencies_ms, 50)), 4),
+            "p95": round(float(np.percentile(latencies_ms, 95)), 4),
+            "p99": round(float(np.percentile(latencies_ms, 99)), 4),
+        },
+        "peak_rss_mb": round(peak_rss_mb(), 1),
+    }
+
+
+def time_calls(fn: Callable, args_list: List[tuple]) -> List[float]:
+    """Wall time of fn for each argument tuple, after one warm-up call"""
+    fn(*args_list[0])
+    latencies = []
+    for args in args_list:
+        start = time.perf_counter()
+        fn(*args)
+        latencies.append(time.perf_counter() - start)
+    return latencies
+
+
+def run_size(n_careers: int, n_skills: int, profile_skills: int, n_requests: int, batch_size: int, fit_repeat: int,
+             seed: int, only: List[str]) -> List[Dict]:
+    """Run the selected benchmarks against one synthetic catalog"""
+    from catalog import CareerCatalog
+    from ml_model import CareerRecommender
+    from skill_graph import SkillGraph
+
+    catalog = CareerCatalog.from_records(generate_careers(n_careers, n_skills=n_skills, seed=seed))
+    profiles = generate_profiles(n_requests, n_skills=n_skills, skills_per_profile=profile_skills, seed=seed + 1)
+    rng = random.Random(seed + 2)
+    career_ids = [int(catalog.ids[rng.randrange(n_careers)]) for _ in range(n_requests)]
+
+    # Caching off, so every call does the full scoring work
+    recommender = CareerRecommender(catalog, cache_size=0, model_path="",
+                                    skill_graph=SkillGraph.from_dict(generate_skill_graph(n_skills, seed=seed)))
+    results = []
+
+    if "fit" in only:
+        latencies = time_calls(recommender.fit_model, [()] * fit_repeat)
+        results.append(summarize("fit", n_careers, latencies))
+
+    if "recommend" in only:
+        latencies = time_calls(recommender.recommend_careers, [
+            (p["skills"], p["interests"], p["experience_years"], p["education_level"]) for p in profiles
+        ])
+        results.append(summarize("recommend", n_careers, latencies))
+
+    # The other registered scorers, on the same catalog and profiles as TF-IDF above
+    for scorer in ("overlap", "hybrid"):
+        if f"recommend_{scorer}" in only:
+            latencies = time_calls(recommender.recommend_careers, [
+                (p["skills"], p["interests"], p["experience_years"], p["education_level"], 5, scorer) for p in profiles
+            ])
+            results.append(summarize(f"recommend_{scorer}", n_careers, latencies))
+
+    if "recommend_batch" in only:
+        batches = [(profiles[i:i + batch_size],) for i in range(0, len(profiles), batch_size)]
+        latencies = time_calls(recommender.recommend_careers_batch, batches)
+        results.append(summarize("recommend_batch", n_careers, latencies, items_per_call=len(batches[0][0])))
+
+    if "skill_gap" in only:
+        latencies = time_calls(recommender.get_skill_gap_analysis, [
+            (p["skills"].split(", "), career_id) for p, career_id in zip(profiles, career_ids)
+        ])
+        results.append(summarize("skill_gap", n_careers, latencies))
+
+    if "learning_plan" in only:
+        latencies = time_calls(recommender.get_learning_plan, [
+            (p["skills"].split(", "), None, p["interests"], p["experience_years"], p["education_level"]) for p in profiles
+        ])
+        results.append(summarize("learning_plan", n_careers, latencies))
+
+    if "api_recommend" in only or "api_skill_gap" in only or "api_careers_page" in only:
+        from engine import get_engine
+        from responses import CatalogResponses
+        from routes import api
+        from routes.app import app
+
+        # The API answers 503 until the shared engine has loaded, even with the benchmark's recommender swapped in
+        get_engine()
+        api.recommender = recommender
+        api.catalog_responses = CatalogResponses(recommender)
+        client = app.test_client()
+
+        def post(path: str, body: Dict):
+            response = client.post(path, json=body)
+            if response.status_code != 200:
+                raise RuntimeError(f"{path} returned {response.status_code}: {response.get_data(as_text=True)}")
+
+        if "api_recommend" in only:
+            latencies = time_calls(post, [("/api/recommend", p) for p in profiles])
+            results.append(summarize("api_recommend", n_careers, latencies))
+
+        if "api_skill_gap" in only:
+            latencies = time_calls(post, [
+                ("/api/skill-gap", {"skills": p["skills"], "target_career_id": career_id})
+                for p, career_id in zip(profiles, career_ids)
+            ])
+            results.append(summarize("api_skill_gap", n_careers, latencies))
+
+        if "api_careers_page" in only:
+            def get(path: str):
+                response = client.get(path)
+                if response.status_code != 200:
+                    raise RuntimeError(f"{path} returned {response.status_code}: {response.get_data(as_text=True)}")
+
+            latencies = time_calls(get, [
+                (f"/api/careers?offset={rng.randrange(max(n_careers - 100, 1))}&limit=100",) for _ in profiles
+            ])
+            results.append(summarize("api_careers_page", n_careers, latencies))
+
+    return results
+
+
+def compare(results: List[Dict], baseline: List[Dict], tolerance: float) -> bool:
+    """Print results next to the baseline; False when any benchmark regressed beyond tolerance"""
+    previous = {(r["benchmark"], r["careers"]): r for r in baseline}
+    ok = True
+
+    print(f"{'benchmark':<18} {'careers':>8}  {'throughput/s':>14} {'vs base':>8}  {'p95 ms':>10} {'vs base':>8}  {'rss MB':>8}")
+    for r in results:
+        base = previous.get((r["benchmark"], r["careers"]))
+        throughput_change = p95_change = ""
+        if base and base["throughput_per_s"] and r["throughput_per_s"]:
+            ratio = r["throughput_per_s"] / base["throughput_per_s"]
+            p95_ratio = r["latency_ms"]["p95"] / base["latency_ms"]["p95"] if base["latency_ms"]["p95"] else 1.0
+            throughput_change = f"{ratio - 1:+.0%}"
+            p95_change = f"{p95_ratio - 1:+.0%}"
+            if ratio < 1 - tolerance or p95_ratio > 1 + tolerance:
+                ok = False
+                p95_change += " !"
+        print(f"{r['benchmark']:<18} {r['careers']:>8}  {r['throughput_per_s']:>14.1f} {throughput_change:>8}  "
+              f"{r['latency_ms']['p95']:>10.3f} {p95_change:>8}  {r['peak_rss_mb']:>8.1f}")
+
+    return ok
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--careers", type=int, nargs="+", default=[10, 1000, 100000],
+                        help="catalog sizes to benchmark")
+    parser.add_argument("--skills", type=int, default=2000, help="skill vocabulary size")
+    parser.add_argument("--profile-skills", type=int, default=5, help="skills per user profile")
+    parser.add_argument("--requests", type=int, default=200, help="calls per benchmark")
+    parser.add_argument("--batch-size", type=int, default=50, help="profiles per recommend_batch call")
+    parser.add_argument("--fit-repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--only", nargs="+", choices=BENCHMARKS, default=BENCHMARKS)
+    parser.add_argument("--output", help="write results JSON here")
+    parser.add_argument("--baseline", help="results JSON to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="allowed relative regression")
+    parser.add_argument("--single", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.single:
+        # Child process: one catalog size, results written to --output
+        results = run_size(args.careers[0], args.skills, args.profile_skills, args.requests, args.batch_size,
+                           args.fit_repeat, args.seed, args.only)
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f)
+        return
+
+    backend_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    results = []
+    for n_careers in args.careers:
+        with tempfile.NamedTemporaryFile(suffix=".json") as child_output:
+            command = [
+                sys.executable, "-m", "benchmarks.run", "--single", "--careers", str(n_careers),
+                "--skills", str(args.skills), "--profile-skills", str(args.profile_skills),
+                "--requests", str(args.requests), "--batch-size", str(args.batch_size),
+                "--fit-repeat", str(args.fit_repeat), "--seed", str(args.seed), "--only", *args.only,
+                "--output", child_output.name,
+            ]
+            subprocess.run(command, cwd=backend_dir, check=True, stdout=subprocess.DEVNULL)
+            results.extend(json.load(child_output))
+
+    report = {
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "skills": args.skills,
+            "profile_skills": args.profile_skills,
+            "requests": args.requests,
+            "batch_size": args.batch_size,
+            "seed": args.seed,
+        },
+        "results": results,
+    }
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+
+    baseline: Optional[List[Dict]] = None
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)["results"]
+
+    if not compare(results, baseline or [], args.tolerance):
+        print(f"\nRegression beyond {args.tolerance:.0%} against {args.baseline}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
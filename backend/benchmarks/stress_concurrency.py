@@ -0,0 +1,86 @@
+"""Concurrency stress check: scores must never leak between simultaneous requests
+
+Run from the backend directory:
+
+    python -m benchmarks.stress_concurrency
+
+Each thread replays its own profile through the recommender and both Flask
+apps, comparing every response with the answer computed single-threaded.
+Exits non-zero on the first mismatch.
+"""
+import argparse
+import sys
+import threading
+from typing import List, Dict
+
+import app as simple_app
+from routes.app import app as api_app
+from routes.api import recommender
+from benchmarks.generators import generate_profiles
+
+SKILLS = [
+    "python, sql, machine learning", "javascript, react, css", "docker, kubernetes, aws",
+    "linux, network security, python", "excel, tableau, sql", "java, node.js, mongodb",
+]
+
+
+def make_profiles(n: int) -> List[Dict]:
+    """Profiles with real catalog skills so every thread gets a distinct ranking"""
+    profiles = generate_profiles(n)
+    for i, p in enumerate(profiles):
+        p["skills"] = SKILLS[i % len(SKILLS)]
+    return profiles
+
+
+def ranking(recommendations: List[Dict]) -> List[tuple]:
+    return [(r["id"], r["match_score"]) for r in recommendations]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--threads", type=int, default=16)
+    parser.add_argument("--iterations", type=int, default=200)
+    args = parser.parse_args()
+    
+    profiles = make_profiles(args.threads)
+    clients = {"routes.app": api_app.test_client(), "app": simple_app.app.test_client()}
+    
+    def run_once(p: Dict) -> Dict[str, List[tuple]]:
+        return {
+            "recommender": [(r.career_id, r.match_score) for r in recommender.recommend_careers(
+                p["skills"], p["interests"], p["experience_years"], p["education_level"])],
+            **{name: ranking(client.post("/api/recommend", json=p).get_json()["recommendations"])
+               for name, client in clients.items()}
+        }
+    
+    expected = [run_once(p) for p in profiles]
+    failures = []
+    start = threading.Barrier(args.threads)
+    
+    def worker(i: int):
+        start.wait()
+        for _ in range(args.iterations):
+            got = run_once(profiles[i])
+            if got != expected[i]:
+                failures.append((i, expected[i], got))
+                return
+    
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(args.threads)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    
+    # Both apps serve the shared engine's catalog
+    shared_scores = {c["match_score"] for c in recommender.catalog}
+    if shared_scores != {0}:
+        failures.append(("shared career data was mutated", shared_scores))
+    
+    if failures:
+        print(f"FAILED: {failures[0]}")
+        sys.exit(1)
+    print(f"OK: {args.threads} threads x {args.iterations} iterations, no leaked scores")
+
+
+if __name__ == "__main__":
+    main()
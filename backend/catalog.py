@@ -0,0 +1,396 @@
+"""Columnar career catalog
+
+A catalog keeps the columns used for scoring (min experience, education
+bitmask, category codes and skill-index CSR arrays) as NumPy arrays and
+decodes full career records only when they are asked for.
+
+Catalogs are built in memory from a list of career dicts, or opened from a
+directory written by ``CareerCatalog.save``. Opened catalogs memory-map every
+array and the records file, so gunicorn workers share the same pages.
+
+Convert a JSON catalog from the backend directory with:
+
+    python -m catalog data/careers.json data/careers.catalog
+"""
+import argparse
+import hashlib
+import json
+import mmap
+import os
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+from scipy.sparse import csr_matrix, vstack
+
+# Education levels encoded as bits in the education mask
+EDUCATION_LEVELS = ["High School", "Associate's", "Bachelor's", "Master's", "PhD"]
+
+DEFAULT_CATALOG_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "careers.json")
+
+CATALOG_FORMAT_VERSION = 1
+
+# Arrays written by save() and memory-mapped by open()
+ARRAY_COLUMNS = [
+    "ids", "min_experience", "education_mask", "category_codes",
+    "required_indptr", "required_indices", "recommended_indptr", "recommended_indices",
+    "required_by_skill_indptr", "required_by_skill", "recommended_by_skill_indptr", "recommended_by_skill",
+    "record_offsets",
+]
+
+
+def record_bytes(career: Dict) -> bytes:
+    """Canonical serialized form of a career record"""
+    return json.dumps(career, sort_keys=True, ensure_ascii=False).encode("utf-8")
+
+
+class CareerCatalog(Sequence):
+    """Career records plus the columnar arrays compiled from them"""
+
+    def __init__(self, columns: Dict[str, np.ndarray], categories: List[str], skills: List[str],
+                 records: Optional[List[Dict]] = None, records_buffer: Any = None,
+                 fingerprint: Optional[str] = None, path: Optional[str] = None, records_dir: Optional[str] = None,
+                 row_source: Optional[np.ndarray] = None, extra_records: Optional[List[Dict]] = None):
+        for name, values in columns.items():
+            setattr(self, name, values)
+        self.categories = categories
+        self.skills = skills
+        self.skill_lookup = {skill: i for i, skill in enumerate(skills)}
+        self.path = path
+        self._records = records
+        self._records_buffer = records_buffer
+        self._records_dir = records_dir or path
+
+        # Catalogs derived from a mapped one read kept rows from the records file and new ones
+        # from extra_records: row_source[i] >= 0 is a file row, -1 - row_source[i] an extra record
+        self._row_source = row_source
+        self._extra_records = extra_records or []
+        self._fingerprint = fingerprint
+        self._education_fallback: Dict[str, np.ndarray] = {}
+
+        # Sorted ids allow id -> position lookups without a Python dict per career
+        self._id_order = np.argsort(self.ids, kind="stable")
+        self._sorted_ids = self.ids[self._id_order]
+
+    @classmethod
+    def from_records(cls, careers: List[Dict]) -> "CareerCatalog":
+        """Compile an in-memory catalog from career dicts"""
+        n_careers = len(careers)
+        ids = np.empty(n_careers, dtype=np.int64)
+        min_experience = np.empty(n_careers, dtype=np.float64)
+        education_mask = np.zeros(n_careers, dtype=np.uint8)
+        category_codes = np.empty(n_careers, dtype=np.int32)
+        categories: List[str] = []
+        category_lookup: Dict[str, int] = {}
+        skill_lookup: Dict[str, int] = {}
+        skill_columns = {"required": ([0], []), "recommended": ([0], [])}
+
+        for i, career in enumerate(careers):
+            ids[i] = career["id"]
+            min_experience[i] = int(career["experience_needed"].split("-")[0].split()[0])
+
+            for bit, level in enumerate(EDUCATION_LEVELS):
+                if level in career["education"]:
+                    education_mask[i] |= 1 << bit
+
+            category = career["category"]
+            if category not in category_lookup:
+                category_lookup[category] = len(categories)
+                categories.append(category)
+            category_codes[i] = category_lookup[category]
+
+            for relation, (indptr, indices) in skill_columns.items():
+                skills = dict.fromkeys(skill.lower() for skill in career[f"{relation}_skills"])
+                indices.extend(skill_lookup.setdefault(skill, len(skill_lookup)) for skill in skills)
+                indptr.append(len(indices))
+
+        columns = {
+            "ids": ids,
+            "min_experience": min_experience,
+            "education_mask": education_mask,
+            "category_codes": category_codes,
+        }
+        for relation, (indptr, indices) in skill_columns.items():
+            columns.update(cls._skill_columns(relation, indptr, indices, n_careers, len(skill_lookup)))
+
+        return cls(columns, categories, list(skill_lookup), records=careers)
+
+    @staticmethod
+    def _skill_columns(relation: str, indptr: List[int], indices: List[int], n_careers: int,
+                       n_skills: int) -> Dict[str, np.ndarray]:
+        """Career -> skill CSR arrays and their skill -> career transpose"""
+        indptr = np.array(indptr, dtype=np.int64)
+        indices = np.array(indices, dtype=np.int32)
+        by_skill = csr_matrix((np.ones(len(indices), dtype=np.int8), indices, indptr),
+                              shape=(n_careers, n_skills)).tocsc()
+        by_skill.sort_indices()
+
+        return {
+            f"{relation}_indptr": indptr,
+            f"{relation}_indices": indices,
+            f"{relation}_by_skill_indptr": by_skill.indptr.astype(np.int64),
+            f"{relation}_by_skill": by_skill.indices.astype(np.int32),
+        }
+
+    @classmethod
+    def open(cls, path: str) -> "CareerCatalog":
+        """Memory-map a catalog directory written by save()"""
+        with open(os.path.join(path, "meta.json"), encoding="utf-8") as f:
+            meta = json.load(f)
+
+        if meta["format_version"] != CATALOG_FORMAT_VERSION:
+            raise ValueError(f"Unsupported catalog format version {meta['format_version']} in {path}")
+
+        columns = {name: np.load(os.path.join(path, f"{name}.npy"), mmap_mode="r") for name in ARRAY_COLUMNS}
+
+        with open(os.path.join(path, "records.jsonl"), "rb") as f:
+            records_buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if os.fstat(f.fileno()).st_size else b""
+
+        return cls(columns, meta["categories"], meta["skills"], records_buffer=records_buffer,
+                   fingerprint=meta["fingerprint"], path=path)
+
+    def save(self, path: str):
+        """Write the catalog as a directory of .npy columns plus a records file"""
+        os.makedirs(path, exist_ok=True)
+        offsets = [0]
+        digest = hashlib.sha256()
+
+        with open(os.path.join(path, "records.jsonl"), "wb") as f:
+            for career in self:
+                line = record_bytes(career) + b"\n"
+                f.write(line)
+                digest.update(line)
+                offsets.append(offsets[-1] + len(line))
+
+        columns = {name: getattr(self, name) for name in ARRAY_COLUMNS if name != "record_offsets"}
+        columns["record_offsets"] = np.array(offsets, dtype=np.int64)
+        for name, values in columns.items():
+            np.save(os.path.join(path, f"{name}.npy"), np.ascontiguousarray(values))
+
+        with open(os.path.join(path, "meta.json"), "w", encoding="utf-8") as f:
+            json.dump({
+                "format_version": CATALOG_FORMAT_VERSION,
+                "n_careers": len(self),
+                "fingerprint": digest.hexdigest(),
+                "categories": self.categories,
+                "skills": self.skills
+            }, f, ensure_ascii=False)
+
+    def apply_changes(self, upserts: List[Dict], removed_ids: Iterable[int] = ()) -> Tuple["CareerCatalog", np.ndarray]:
+        """New catalog with careers added or replaced and others removed
+
+        Also returns the mask of current positions that were kept; kept careers
+        come first in their current order, followed by the upserted ones.
+        """
+        keep = np.ones(len(self), dtype=bool)
+        for career_id in [c["id"] for c in upserts] + list(removed_ids):
+            position = self.position(career_id)
+            if position is not None:
+                keep[position] = False
+
+        added = CareerCatalog.from_records(upserts)
+
+        # Existing skill and category codes stay stable; new ones are appended
+        skills = list(self.skills)
+        skill_lookup = dict(self.skill_lookup)
+        skill_remap = np.array([skill_lookup.setdefault(s, len(skill_lookup)) for s in added.skills], dtype=np.int32)
+        skills.extend(skill for skill in skill_lookup if skill_lookup[skill] >= len(skills))
+        categories = list(self.categories)
+        category_lookup = {category: i for i, category in enumerate(categories)}
+        category_remap = np.array([category_lookup.setdefault(c, len(category_lookup)) for c in added.categories],
+                                  dtype=np.int32)
+        categories.extend(c for c in category_lookup if category_lookup[c] >= len(categories))
+
+        n_careers = int(keep.sum()) + len(added)
+        columns = {
+            "ids": np.concatenate([self.ids[keep], added.ids]),
+            "min_experience": np.concatenate([self.min_experience[keep], added.min_experience]),
+            "education_mask": np.concatenate([self.education_mask[keep], added.education_mask]),
+            "category_codes": np.concatenate([self.category_codes[keep], category_remap[added.category_codes]]),
+        }
+        for relation in ("required", "recommended"):
+            merged = vstack([
+                self._skill_matrix(relation, len(skills))[keep],
+                csr_matrix((np.ones(len(getattr(added, f"{relation}_indices")), dtype=np.int8),
+                            skill_remap[getattr(added, f"{relation}_indices")], getattr(added, f"{relation}_indptr")),
+                           shape=(len(added), len(skills)))
+            ], format="csr")
+            columns.update(self._skill_columns(relation, merged.indptr, merged.indices, n_careers, len(skills)))
+
+        if self._records is not None:
+            records = [career for career, kept in zip(self._records, keep) if kept] + list(upserts)
+            return CareerCatalog(columns, categories, skills, records=records), keep
+
+        # Mapped catalogs keep reading unchanged careers from the records file
+        row_source = self._row_source if self._row_source is not None else np.arange(len(self), dtype=np.int64)
+        extra_records = self._extra_records + list(upserts)
+        new_sources = -1 - np.arange(len(self._extra_records), len(extra_records), dtype=np.int64)
+        columns["record_offsets"] = self.record_offsets
+        catalog = CareerCatalog(columns, categories, skills, records_buffer=self._records_buffer,
+                                records_dir=self._records_dir, row_source=np.concatenate([row_source[keep], new_sources]),
+                                extra_records=extra_records)
+        return catalog, keep
+
+    def compact(self) -> "CareerCatalog":
+        """This catalog with its records packed into one bytes buffer instead of a dict per career
+
+        A buffer holds no per-career Python objects, so its pages are never
+        written by reference counting or garbage collection and stay shared
+        between forked workers. Records are decoded on access, as for mapped
+        catalogs. Unmodified mapped catalogs are returned as they are.
+        """
+        if self._records is None and self._row_source is None:
+            return self
+
+        chunks = [record_bytes(career) for career in self]
+        record_offsets = np.zeros(len(chunks) + 1, dtype=np.int64)
+        np.cumsum([len(chunk) for chunk in chunks], out=record_offsets[1:])
+
+        fingerprint = self._fingerprint
+        if fingerprint is None:
+            digest = hashlib.sha256()
+            for chunk in chunks:
+                digest.update(chunk + b"\n")
+            fingerprint = digest.hexdigest()
+
+        columns = {name: getattr(self, name) for name in ARRAY_COLUMNS if name != "record_offsets"}
+        columns["record_offsets"] = record_offsets
+        return CareerCatalog(columns, self.categories, self.skills, records_buffer=b"".join(chunks),
+                             fingerprint=fingerprint)
+
+    def _skill_matrix(self, relation: str, n_skills: int) -> csr_matrix:
+        """Career x skill incidence matrix for required or recommended skills"""
+        indices = getattr(self, f"{relation}_indices")
+        return csr_matrix((np.ones(len(indices), dtype=np.int8), indices, getattr(self, f"{relation}_indptr")),
+                          shape=(len(self), n_skills))
+
+    def __getstate__(self):
+        # Unmodified mapped catalogs are re-opened from disk instead of pickling their arrays
+        if self.path is not None:
+            return {"path": self.path}
+
+        state = dict(self.__dict__)
+        if isinstance(self._records_buffer, mmap.mmap):
+            state["_records_buffer"] = None
+        return state
+
+    def __setstate__(self, state):
+        if set(state) == {"path"}:
+            state = CareerCatalog.open(state["path"]).__dict__
+        elif state.get("_records_dir") and state.get("_records") is None:
+            state["_records_buffer"] = CareerCatalog.open(state["_records_dir"])._records_buffer
+        self.__dict__.update(state)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __getitem__(self, position: int) -> Dict:
+        """Career record at a catalog position, decoded lazily for mapped catalogs"""
+        if self._records is not None:
+            return self._records[position]
+
+        if position < 0:
+            position += len(self)
+        if not 0 <= position < len(self):
+            raise IndexError("catalog position out of range")
+
+        row = position if self._row_source is None else self._row_source[position]
+        if row < 0:
+            return self._extra_records[-1 - row]
+
+        start, end = self.record_offsets[row], self.record_offsets[row + 1]
+        return json.loads(self._records_buffer[start:end])
+
+    def __iter__(self) -> Iterator[Dict]:
+        if self._records is not None:
+            return iter(self._records)
+        return (self[i] for i in range(len(self)))
+
+    @property
+    def fingerprint(self) -> str:
+        """SHA-256 of the canonical records, identifying this catalog version"""
+        if self._fingerprint is None:
+            digest = hashlib.sha256()
+            for career in self:
+                digest.update(record_bytes(career) + b"\n")
+            self._fingerprint = digest.hexdigest()
+        return self._fingerprint
+
+    def position(self, career_id: int) -> Optional[int]:
+        """Catalog position of a career id"""
+        i = np.searchsorted(self._sorted_ids, career_id)
+        if i < len(self._sorted_ids) and self._sorted_ids[i] == career_id:
+            return int(self._id_order[i])
+        return None
+
+    def get(self, career_id: int) -> Optional[Dict]:
+        """Look up a career record by id"""
+        position = self.position(career_id)
+        return self[position] if position is not None else None
+
+    def skill_ids(self, skills: Iterable[str]) -> frozenset:
+        """Interned ids of the given lowercased skills; skills no career lists are dropped"""
+        lookup = self.skill_lookup
+        return frozenset(lookup[skill] for skill in skills if skill in lookup)
+
+    def skill_id_list(self, relation: str, position: int) -> List[int]:
+        """Interned ids of the required or recommended skills of the career at a position, in listed order"""
+        indptr = getattr(self, f"{relation}_indptr")
+        return getattr(self, f"{relation}_indices")[indptr[position]:indptr[position + 1]].tolist()
+
+    def careers_with_skill(self, skill: str) -> List[Tuple[int, str]]:
+        """(position, required|recommended) of every career using a skill, in catalog order"""
+        skill_id = self.skill_lookup.get(skill.lower().strip())
+        if skill_id is None:
+            return []
+
+        matches = []
+        for rank, relation in enumerate(("required", "recommended")):
+            indptr = getattr(self, f"{relation}_by_skill_indptr")
+            positions = getattr(self, f"{relation}_by_skill")[indptr[skill_id]:indptr[skill_id + 1]]
+            matches.extend((int(p), rank, relation) for p in positions)
+
+        return [(position, relation) for position, _, relation in sorted(matches)]
+
+    def education_matches(self, education_level: str) -> np.ndarray:
+        """Boolean mask of careers whose education mentions the given level"""
+        if education_level in EDUCATION_LEVELS:
+            return (self.education_mask & (1 << EDUCATION_LEVELS.index(education_level))) != 0
+
+        # Free-text levels fall back to a substring scan, remembered for a handful of distinct inputs
+        matches = self._education_fallback.get(education_level)
+        if matches is None:
+            matches = np.array([education_level in c["education"] for c in self], dtype=bool)
+            if len(self._education_fallback) < 32:
+                self._education_fallback[education_level] = matches
+        return matches
+
+
+def load_catalog(path: str = DEFAULT_CATALOG_PATH) -> CareerCatalog:
+    """Load a catalog from a JSON list of careers or a catalog directory"""
+    if os.path.isdir(path):
+        return CareerCatalog.open(path)
+
+    with open(path, encoding="utf-8") as f:
+        return CareerCatalog.from_records(json.load(f))
+
+
+def as_catalog(career_data: Union[CareerCatalog, List[Dict]]) -> CareerCatalog:
+    """Wrap a plain list of careers in a catalog"""
+    if isinstance(career_data, CareerCatalog):
+        return career_data
+    return CareerCatalog.from_records(list(career_data))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Convert a JSON career list into a memory-mappable catalog")
+    parser.add_argument("source", help="JSON file with a list of careers")
+    parser.add_argument("output", help="catalog directory to write")
+    args = parser.parse_args()
+
+    catalog = load_catalog(args.source)
+    catalog.save(args.output)
+    print(f"Wrote {len(catalog)} careers to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""Process-wide recommendation engine
+
+Every app in a process (app.py, routes/app.py, routes/asgi.py) serves from
+the same CareerRecommender, so they share one fitted model, one cache and one
+catalog. The scorer is chosen per deployment with CAREER_SCORER or per request
+with a "scorer" field; app.py keeps its own overlap default.
+
+Importing the apps builds nothing. start_engine() builds the recommender on a
+background thread once the server is up: from the gunicorn hooks in
+gunicorn.conf.py, from the ASGI lifespan startup, before app.py's development
+server starts, and otherwise on the first request. The server therefore binds its port and answers liveness checks
+straight away. engine_status() tells whether the model is loading, ready or
+failed; until it is ready, the apps answer scoring requests with 503 and a
+Retry-After header, which the frontend honours by retrying. get_engine() starts the load if needed and blocks until
+it is done.
+
+A process forked while the load is running (a gunicorn worker forked from a
+preloading master) does not inherit the loading thread. It reports the model
+as loading until gunicorn.conf.py replaces it with a worker forked after the
+load.
+"""
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from ml_model import CareerRecommender
+
+LOADING, READY, FAILED = "loading", "ready", "failed"
+
+_engine: Optional[CareerRecommender] = None
+_engine_lock = threading.Lock()
+_loader: Optional[threading.Thread] = None
+_error: Optional[BaseException] = None
+_load_seconds: Optional[float] = None
+
+
+class EngineNotReady(RuntimeError):
+    """The recommender did not finish loading in time"""
+
+
+def _load():
+    global _engine, _error, _load_seconds
+    start = time.perf_counter()
+    try:
+        engine = CareerRecommender()
+    except BaseException as e:
+        _load_seconds = time.perf_counter() - start
+        _error = e
+    else:
+        _load_seconds = time.perf_counter() - start
+        _engine = engine
+
+
+def start_engine():
+    """Start building the shared recommender in the background, once per process"""
+    global _loader
+    if _loader is None:
+        with _engine_lock:
+            if _loader is None:
+                _loader = threading.Thread(target=_load, name="career-engine-load", daemon=True)
+                _loader.start()
+
+
+def get_engine(timeout: Optional[float] = None) -> CareerRecommender:
+    """The shared recommender, waiting for it to load; raises EngineNotReady after timeout seconds"""
+    if _engine is None:
+        start_engine()
+        _loader.join(timeout)
+        if _error is not None:
+            raise RuntimeError(f"Recommender failed to load: {_error}") from _error
+        if _engine is None:
+            # Still loading, or loading in the process this one was forked from
+            raise EngineNotReady("Recommender is still loading")
+    return _engine
+
+
+def is_ready() -> bool:
+    return _engine is not None
+
+
+def engine_status() -> Dict[str, Any]:
+    """Load state of the shared recommender: loading, ready or failed"""
+    if _engine is not None:
+        return {"state": READY, "load_seconds": round(_load_seconds, 3)}
+    if _error is not None:
+        return {"state": FAILED, "error": str(_error), "load_seconds": round(_load_seconds, 3)}
+    return {"state": LOADING}
+
+
+class _EngineProxy:
+    """Stand-in for the shared recommender that apps can hold from import time
+
+    Attribute access waits for the load to finish, so nothing blocks until
+    the model is actually used.
+    """
+
+    def __getattr__(self, name: str):
+        return getattr(get_engine(), name)
+
+    def __repr__(self) -> str:
+        return f"<shared recommender ({engine_status()['state']})>"
+
+
+recommender = _EngineProxy()
@@ -0,0 +1,75 @@
+"""Gunicorn settings, read automatically when gunicorn starts in the backend directory
+
+The app is loaded once in the master and workers are forked from it, so they
+share the fitted model instead of each building their own. Everything large
+is kept in flat buffers (NumPy arrays, the TF-IDF matrix, the packed or
+memory-mapped catalog records), whose pages are never written after the fork.
+The remaining Python objects are frozen out of the garbage collector, so
+collections in the workers do not touch them and copy their pages either.
+
+Importing the app does not load the model. when_ready runs once the master
+has bound its sockets and starts the load on a background thread, so workers
+are forked straight away and answer /api/health, with 503 on /api/ready and
+the scoring endpoints, while the master loads. When the model is ready, the
+master sends itself SIGHUP, so gunicorn starts new workers forked from the
+loaded process, which share the model as above, and then gracefully stops
+the early ones. With preload_app off,
+post_worker_init starts each worker's own load in the background instead.
+
+Worker count follows --workers or WEB_CONCURRENCY; see
+benchmarks/memory_report.py for per-worker memory and
+benchmarks/bench_import.py for import and startup time.
+"""
+import gc
+import os
+import signal
+import threading
+
+preload_app = True
+
+# Objects freed while the model loads would leave holes that later allocations fill in shared pages
+gc.disable()
+
+
+def when_ready(server):
+    if not server.cfg.preload_app:
+        gc.enable()
+        return
+
+    from engine import start_engine
+
+    # Started before any fork, so workers forked during the load know it is under way and do not start their own
+    start_engine()
+    threading.Thread(target=share_engine, args=(server,), name="career-engine-share", daemon=True).start()
+
+
+def share_engine(server):
+    """Wait for the model, prepare it for copy-on-write sharing and have the workers forked without it replaced"""
+    from engine import get_engine
+
+    try:
+        engine = get_engine()
+        engine.compact_catalog()
+
+        # No background thread may hold a lock, or be half way through a swap, at fork time
+        engine.wait_for_background()
+    except Exception:
+        # Replacement workers inherit the failure and report it on /api/ready
+        server.log.exception("Loading the recommender failed")
+
+    gc.collect()
+    gc.freeze()
+
+    # A graceful reload: the arbiter forks new workers and stops the old ones from its own loop
+    os.kill(os.getpid(), signal.SIGHUP)
+
+
+def post_fork(server, worker):
+    gc.enable()
+
+
+def post_worker_init(worker):
+    if not worker.cfg.preload_app:
+        from engine import start_engine
+
+        start_engine()
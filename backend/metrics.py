@@ -0,0 +1,194 @@
+"""Low-overhead request and stage latency metrics in Prometheus text format
+
+Flask handlers are wrapped with metrics.instrument(endpoint), which counts
+every request by endpoint and status and decides whether the request is
+sampled. Inside a sampled request, metrics.stage(name) blocks time the
+individual stages (parse, vectorize, similarity, adjust, sort, serialize, ...)
+into fixed-bucket histograms. Outside a sampled request a stage block only
+reads a context variable, so the instrumentation can stay on in production;
+CAREER_METRICS_SAMPLE_RATE (default 1.0) sets the fraction of requests timed.
+
+Metrics are kept per process: with several gunicorn workers each one reports
+its own counts, which Prometheus sums across scrape targets.
+"""
+import functools
+import os
+import random
+import threading
+import time
+from bisect import bisect_left
+from contextvars import ContextVar
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+# Histogram bucket upper bounds in seconds: 10us to ~10s, two buckets per doubling
+BUCKETS = [1e-5 * 2 ** (i / 2) for i in range(41)]
+QUANTILES = [0.5, 0.95, 0.99]
+
+_sampled: ContextVar[bool] = ContextVar("metrics_sampled", default=False)
+
+
+class Histogram:
+    """Cumulative-bucket latency histogram with interpolated quantiles"""
+
+    def __init__(self, buckets: List[float] = BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, seconds: float):
+        self.counts[bisect_left(self.buckets, seconds)] += 1
+        self.count += 1
+        self.sum += seconds
+
+    def quantile(self, q: float) -> float:
+        """Estimate of the q-quantile, interpolated linearly inside its bucket"""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for i, n in enumerate(self.counts):
+            if n and seen + n >= rank:
+                lower = self.buckets[i - 1] if i > 0 else 0.0
+                upper = self.buckets[i] if i < len(self.buckets) else self.buckets[-1]
+                return lower + (upper - lower) * (rank - seen) / n
+            seen += n
+        return self.buckets[-1]
+
+
+class _Stage:
+    """Context manager timing one stage of a sampled request"""
+    __slots__ = ("metrics", "name", "start")
+
+    def __init__(self, metrics: "Metrics", name: str):
+        self.metrics = metrics
+        self.name = name
+        self.start = None
+
+    def __enter__(self):
+        if _sampled.get():
+            self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        if self.start is not None:
+            self.metrics.observe_stage(self.name, time.perf_counter() - self.start)
+
+
+class Metrics:
+    """Request counters and per-stage latency histograms"""
+
+    def __init__(self, sample_rate: Optional[float] = None):
+        if sample_rate is None:
+            sample_rate = float(os.environ.get("CAREER_METRICS_SAMPLE_RATE", 1.0))
+        self.sample_rate = min(max(sample_rate, 0.0), 1.0)
+        self.requests: Dict[Tuple[str, int], int] = {}
+        self.request_latency: Dict[str, Histogram] = {}
+        self.stage_latency: Dict[str, Histogram] = {}
+        self._lock = threading.Lock()
+
+    def sample(self) -> bool:
+        """Whether the next request should be timed"""
+        return self.sample_rate >= 1.0 or (self.sample_rate > 0.0 and random.random() < self.sample_rate)
+
+    def stage(self, name: str) -> _Stage:
+        """Time a block as one stage of the current request, if it is sampled"""
+        return _Stage(self, name)
+
+    def observe_stage(self, name: str, seconds: float):
+        with self._lock:
+            histogram = self.stage_latency.get(name)
+            if histogram is None:
+                histogram = self.stage_latency[name] = Histogram()
+            histogram.observe(seconds)
+
+    def observe_request(self, endpoint: str, status: int, seconds: Optional[float]):
+        with self._lock:
+            key = (endpoint, status)
+            self.requests[key] = self.requests.get(key, 0) + 1
+            if seconds is not None:
+                histogram = self.request_latency.get(endpoint)
+                if histogram is None:
+                    histogram = self.request_latency[endpoint] = Histogram()
+                histogram.observe(seconds)
+
+    def instrument(self, endpoint: str) -> Callable:
+        """Decorator counting a Flask view's requests and timing the sampled ones"""
+        def decorator(view):
+            @functools.wraps(view)
+            def wrapper(*args, **kwargs):
+                sampled = self.sample()
+                token = _sampled.set(sampled)
+                start = time.perf_counter()
+                status = 500
+                try:
+                    rv = view(*args, **kwargs)
+                    status = rv[1] if isinstance(rv, tuple) else getattr(rv, "status_code", 200)
+                    return rv
+                finally:
+                    _sampled.reset(token)
+                    self.observe_request(endpoint, status, time.perf_counter() - start if sampled else None)
+            return wrapper
+        return decorator
+
+    def reset(self):
+        with self._lock:
+            self.requests.clear()
+            self.request_latency.clear()
+            self.stage_latency.clear()
+
+    def render(self, gauges: Iterable[Tuple[str, str, float]] = ()) -> str:
+        """Prometheus text exposition of all metrics plus (name, help, value) gauges"""
+        with self._lock:
+            requests = sorted(self.requests.items())
+            families = [
+                ("career_request_duration_seconds", "Latency of sampled requests", "endpoint",
+                 {k: self._copy(h) for k, h in self.request_latency.items()}),
+                ("career_stage_duration_seconds", "Latency of stages within sampled requests", "stage",
+                 {k: self._copy(h) for k, h in self.stage_latency.items()}),
+            ]
+
+        lines = [
+            "# HELP career_requests_total Requests handled, by endpoint and status",
+            "# TYPE career_requests_total counter",
+        ]
+        lines.extend(f'career_requests_total{{endpoint="{e}",status="{s}"}} {n}' for (e, s), n in requests)
+
+        for name, help_text, label, histograms in families:
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} histogram")
+            for key in sorted(histograms):
+                histogram = histograms[key]
+                cumulative = 0
+                for bound, n in zip(histogram.buckets, histogram.counts):
+                    cumulative += n
+                    lines.append(f'{name}_bucket{{{label}="{key}",le="{bound:.6g}"}} {cumulative}')
+                lines.append(f'{name}_bucket{{{label}="{key}",le="+Inf"}} {histogram.count}')
+                lines.append(f'{name}_sum{{{label}="{key}"}} {histogram.sum:.9f}')
+                lines.append(f'{name}_count{{{label}="{key}"}} {histogram.count}')
+
+            # Precomputed p50/p95/p99 for readers without a Prometheus server
+            lines.append(f"# HELP {name}_quantile {help_text}, estimated quantiles")
+            lines.append(f"# TYPE {name}_quantile gauge")
+            for key in sorted(histograms):
+                for q in QUANTILES:
+                    lines.append(f'{name}_quantile{{{label}="{key}",quantile="{q}"}} {histograms[key].quantile(q):.9f}')
+
+        for name, help_text, value in gauges:
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} gauge")
+            lines.append(f"{name} {value}")
+
+        return "\n".join(lines) + "\n"
+
+    @staticmethod
+    def _copy(histogram: Histogram) -> Histogram:
+        copy = Histogram(histogram.buckets)
+        copy.counts = list(histogram.counts)
+        copy.count = histogram.count
+        copy.sum = histogram.sum
+        return copy
+
+
+# Process-wide metrics shared by the model and the API handlers
+metrics = Metrics()
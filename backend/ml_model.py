@@ -1,206 +1,899 @@
-import pandas as pd
 import numpy as np
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
-import joblib
+from scipy.sparse import diags, vstack
+import hashlib
 import json
-from typing import List, Dict, Any
+import logging
+import os
+import threading
+import time
+from types import MappingProxyType
+from typing import TYPE_CHECKING, List, Dict, Any, Optional, Mapping, Tuple, Union, Iterable
+
+import artifact
+from cache import TTLCache
+from catalog import CareerCatalog, DEFAULT_CATALOG_PATH, as_catalog, load_catalog
+from metrics import metrics
+from precompute import TopKTable, build_table
+from skill_graph import DEFAULT_GRAPH_PATH, SkillGraph, load_skill_graph
+from skills import SkillNormalizer, profile_text
+
+# scikit-learn and joblib take most of the import time, so they are imported where they are first used
+if TYPE_CHECKING:
+    from sklearn.feature_extraction.text import TfidfVectorizer
+
+logger = logging.getLogger(__name__)
+
+# Upper bound on profiles x careers scores held in memory at once by batch scoring
+BATCH_BLOCK_ELEMENTS = 1 << 22
+
+# Settings shared by every vectorizer the recommender builds
+VECTORIZER_PARAMS = {"stop_words": "english", "max_features": 1000}
+
+def career_text(career: Dict) -> str:
+    """Text a career is vectorized from"""
+    return " ".join(career["required_skills"]) + " " + career["description"] + " " + career["category"]
+
+def make_vectorizer(vocabulary: Dict[str, int], idf: np.ndarray) -> "TfidfVectorizer":
+    """TF-IDF vectorizer with a given vocabulary and IDF weights, ready to transform"""
+    from sklearn.feature_extraction.text import TfidfVectorizer
+    
+    vectorizer = TfidfVectorizer(**VECTORIZER_PARAMS)
+    vectorizer.vocabulary_ = vocabulary
+    vectorizer.idf_ = idf
+    return vectorizer
+
+def inverse_document_frequency(term_counts) -> np.ndarray:
+    """Smoothed IDF weights, computed the same way TfidfVectorizer does"""
+    n_documents = term_counts.shape[0]
+    document_frequency = np.bincount(term_counts.indices, minlength=term_counts.shape[1])
+    return np.log((1 + n_documents) / (1 + document_frequency)) + 1
+
+def weight_term_counts(term_counts, idf: np.ndarray):
+    """L2-normalized TF-IDF rows from raw term counts"""
+    from sklearn.preprocessing import normalize
+    
+    weighted = (term_counts @ diags(idf)).tocsr()
+    return normalize(weighted, norm="l2", copy=False) if weighted.shape[0] else weighted
+
+class Recommendation:
+    """Immutable scoring result that references a career instead of copying it"""
+    __slots__ = ("career_id", "match_score", "_catalog", "_index")
+    
+    def __init__(self, catalog: CareerCatalog, index: int, match_score: float):
+        object.__setattr__(self, "_catalog", catalog)
+        object.__setattr__(self, "_index", index)
+        object.__setattr__(self, "career_id", int(catalog.ids[index]))
+        object.__setattr__(self, "match_score", match_score)
+    
+    def __setattr__(self, name, value):
+        raise AttributeError("Recommendation is immutable")
+    
+    def __repr__(self) -> str:
+        return f"Recommendation(career_id={self.career_id!r}, match_score={self.match_score!r})"
+    
+    @property
+    def career(self) -> Mapping[str, Any]:
+        """Read-only view of the recommended career"""
+        return MappingProxyType(self._catalog[self._index])
+    
+    def to_dict(self) -> Dict:
+        """Materialize the career together with its match score"""
+        return dict(self._catalog[self._index], match_score=self.match_score)
+
+class CandidateRetriever:
+    """Retrieval stage choosing which careers are worth exact scoring for a user vector"""
+    
+    def fit(self, tfidf_matrix) -> Any:
+        """Build an index over the fitted TF-IDF matrix"""
+        return None
+    
+    def update(self, index: Any, keep: np.ndarray, new_rows) -> Any:
+        """Index after the rows marked in keep survive and new_rows are appended"""
+        return index
+    
+    def candidates(self, index: Any, user_vector, top_k: int) -> Optional[np.ndarray]:
+        """Catalog positions to score exactly, or None to score the whole catalog"""
+        return None
+
+class ExactRetriever(CandidateRetriever):
+    """Scores every career; the reference the approximate retrievers are measured against"""
+
+class IVFRetriever(CandidateRetriever):
+    """Truncated-SVD embeddings grouped into k-means partitions, searched by probing the nearest ones
+    
+    n_probe is the recall/latency knob: more probed partitions means more
+    careers scored exactly. Catalogs smaller than min_catalog_size, users with
+    no known terms and probes yielding fewer than top_k careers fall back to
+    exact search.
+    """
+    
+    def __init__(self, n_components: int = 64, n_partitions: Optional[int] = None, n_probe: int = 16,
+                 min_catalog_size: int = 20000, random_state: int = 0):
+        self.n_components = n_components
+        self.n_partitions = n_partitions
+        self.n_probe = n_probe
+        self.min_catalog_size = min_catalog_size
+        self.random_state = random_state
+    
+    def fit(self, tfidf_matrix) -> Any:
+        from sklearn.cluster import MiniBatchKMeans
+        from sklearn.decomposition import TruncatedSVD
+        
+        n_careers = tfidf_matrix.shape[0]
+        if n_careers < self.min_catalog_size:
+            return None
+        
+        svd = TruncatedSVD(n_components=min(self.n_components, tfidf_matrix.shape[1] - 1),
+                           random_state=self.random_state)
+        embeddings = self._normalize(svd.fit_transform(tfidf_matrix))
+        
+        n_partitions = self.n_partitions or int(np.sqrt(n_careers))
+        kmeans = MiniBatchKMeans(n_clusters=n_partitions, random_state=self.random_state, n_init=3,
+                                 batch_size=4096).fit(embeddings)
+        
+        return (svd, self._normalize(kmeans.cluster_centers_)) + self._partition(kmeans.labels_, n_partitions)
+    
+    def update(self, index: Any, keep: np.ndarray, new_rows) -> Any:
+        if index is None:
+            return None
+        
+        svd, centroids, members, offsets = index
+        labels = np.empty(len(keep), dtype=np.int64)
+        labels[members] = np.repeat(np.arange(len(centroids)), np.diff(offsets))
+        
+        # New careers join the partition with the nearest centroid
+        new_labels = np.zeros(0, dtype=np.int64)
+        if new_rows.shape[0]:
+            new_labels = np.argmax(self._normalize(svd.transform(new_rows)) @ centroids.T, axis=1)
+        labels = np.concatenate([labels[keep], new_labels])
+        
+        return (svd, centroids) + self._partition(labels, len(centroids))
+    
+    def candidates(self, index: Any, user_vector, top_k: int) -> Optional[np.ndarray]:
+        if index is None or user_vector.nnz == 0:
+            return None
+        
+        svd, centroids, members, offsets = index
+        query = self._normalize(svd.transform(user_vector))[0]
+        n_probe = min(self.n_probe, len(centroids))
+        probed = np.argpartition(-(centroids @ query), n_probe - 1)[:n_probe]
+        
+        positions = np.concatenate([members[offsets[p]:offsets[p + 1]] for p in probed])
+        if len(positions) < top_k:
+            return None
+        
+        positions.sort()  # keep catalog order so ties resolve like exact search
+        return positions
+    
+    @staticmethod
+    def _partition(labels: np.ndarray, n_partitions: int) -> tuple:
+        """Members of every partition stored contiguously: partition p owns members[offsets[p]:offsets[p + 1]]"""
+        members = np.argsort(labels, kind="stable")
+        offsets = np.concatenate([[0], np.cumsum(np.bincount(labels, minlength=n_partitions))])
+        return members, offsets
+    
+    @staticmethod
+    def _normalize(vectors: np.ndarray) -> np.ndarray:
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        return vectors / np.where(norms == 0, 1, norms)
+
+# Candidate retrievers selectable by name, e.g. through CAREER_RETRIEVER
+RETRIEVERS = {
+    "exact": ExactRetriever,
+    "ivf": IVFRetriever,
+}
+
+def make_retriever(name: str) -> CandidateRetriever:
+    """Build a retriever by registry name, reading IVF settings from the environment"""
+    if name not in RETRIEVERS:
+        raise ValueError(f"Unknown retriever {name!r}, expected one of {sorted(RETRIEVERS)}")
+    if name == "ivf":
+        return IVFRetriever(n_probe=int(os.environ.get("CAREER_IVF_PROBES", 16)),
+                            min_catalog_size=int(os.environ.get("CAREER_IVF_MIN_CATALOG_SIZE", 20000)))
+    return RETRIEVERS[name]()
+
+class ModelState:
+    """One consistent version of the fitted model
+    
+    Requests read the recommender's current state once and use only that
+    object, while catalog updates build a new state and swap it in with a
+    single assignment, so readers never need a lock.
+    """
+    
+    def __init__(self, version: int, catalog: CareerCatalog, vectorizer: "TfidfVectorizer", tfidf_matrix,
+                 term_counts, retriever_index: Any = None):
+        self.version = version
+        self.catalog = catalog
+        self.vectorizer = vectorizer
+        self.tfidf_matrix = tfidf_matrix
+        self.term_counts = term_counts
+        self.retriever_index = retriever_index
+        self._fingerprint: Optional[str] = None
+    
+    @property
+    def fingerprint(self) -> str:
+        """SHA-256 identifying the fitted model: the catalog, the vocabulary and the IDF weights"""
+        if self._fingerprint is None:
+            vocabulary = sorted(self.vectorizer.vocabulary_, key=self.vectorizer.vocabulary_.get)
+            digest = hashlib.sha256(self.catalog.fingerprint.encode("ascii"))
+            digest.update("\n".join(vocabulary).encode("utf-8"))
+            digest.update(np.ascontiguousarray(self.vectorizer.idf_, dtype=np.float64).tobytes())
+            self._fingerprint = digest.hexdigest()
+        return self._fingerprint
+    
+    def similarity(self, user_matrix, positions: Optional[np.ndarray] = None) -> np.ndarray:
+        """Cosine similarity of user vectors against every career, or only those at the given positions"""
+        careers = self.tfidf_matrix if positions is None else self.tfidf_matrix[positions]
+        
+        # TF-IDF rows are already L2-normalized, so the dot product is the cosine
+        return (user_matrix @ careers.T).toarray()
+    
+    def education_match(self, education_level: str) -> np.ndarray:
+        """Education multiplier for every career"""
+        return np.where(self.catalog.education_matches(education_level), 1.0, 0.8)
+    
+    def score_careers(self, similarities: np.ndarray, experience_years: float, education_level: str,
+                      positions: Optional[np.ndarray] = None) -> np.ndarray:
+        """Combine similarity with experience and education adjustments"""
+        min_experience = self.catalog.min_experience
+        education_match = self.education_match(education_level)
+        if positions is not None:
+            min_experience = min_experience[positions]
+            education_match = education_match[positions]
+        
+        base_score = similarities * 100
+        exp_adjustment = np.minimum(experience_years / min_experience, 1.5) * 20
+        scores = np.round(base_score * education_match + exp_adjustment, 2)
+        
+        return np.minimum(scores, 99.9)  # Cap at 99.9
+
+class Scorer:
+    """Scores careers for one user profile against a model state"""
+    name = ""
+    
+    def score(self, state: ModelState, retriever: CandidateRetriever, skills: Tuple[str, ...], text: str,
+              experience_years: float, education_level: str, top_k: int) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+        """Scores of the careers at the returned positions (None means the whole catalog)
+        
+        skills are the canonical skills; text is what the profile is vectorized from (skills.profile_text).
+        """
+        raise NotImplementedError
+
+class OverlapScorer(Scorer):
+    """Share of a career's required skills the user has, plus an experience bonus
+    
+    The cheapest scorer: no vectorization, only integer counts gathered from
+    the catalog's skill -> career index. Interests and education are ignored.
+    """
+    name = "overlap"
+    
+    def score(self, state, retriever, skills, text, experience_years, education_level, top_k):
+        catalog = state.catalog
+        required = np.maximum(np.diff(catalog.required_indptr), 1)
+        skill_match = skill_overlap(catalog, skills, "required") / required * 70
+        exp_adjustment = np.minimum(experience_years / catalog.min_experience, 1.5) * 30
+        
+        return np.minimum(np.round(skill_match + exp_adjustment, 1), 99.9), None
+
+class TfidfScorer(Scorer):
+    """Cosine similarity of TF-IDF vectors, adjusted for experience and education"""
+    name = "tfidf"
+    
+    def score(self, state, retriever, skills, text, experience_years, education_level, top_k):
+        similarities, positions = self.similarities(state, retriever, skills, text, top_k)
+        
+        # Adjust scores based on experience and education
+        with metrics.stage("adjust"):
+            scores = state.score_careers(similarities, experience_years, education_level, positions)
+        
+        return scores, positions
+    
+    def similarities(self, state: ModelState, retriever: CandidateRetriever, skills: Tuple[str, ...], text: str,
+                     top_k: int) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+        """Cosine similarity of the careers at the returned positions (None means the whole catalog)"""
+        # Transform user input
+        with metrics.stage("vectorize"):
+            user_vector = state.vectorizer.transform([text])
+        
+        # Retrieve candidates (None means the whole catalog) and calculate their similarity
+        with metrics.stage("similarity"):
+            positions = self.candidates(state, retriever, skills, user_vector, top_k)
+            similarities = state.similarity(user_vector, positions).ravel()
+        
+        return similarities, positions
+    
+    def candidates(self, state: ModelState, retriever: CandidateRetriever, skills: Tuple[str, ...], user_vector,
+                   top_k: int) -> Optional[np.ndarray]:
+        return retriever.candidates(state.retriever_index, user_vector, top_k)
+
+class HybridScorer(TfidfScorer):
+    """TF-IDF scoring of only the careers sharing the most skills with the user
+    
+    The count of required skills the user has is a cheap prefilter; the
+    max(top_k * candidate_factor, min_candidates) best careers by overlap are
+    scored with TF-IDF. Careers that match only on interests are never
+    candidates, which is the quality traded for latency. Users overlapping
+    fewer than top_k careers are scored against the whole catalog.
+    """
+    name = "hybrid"
+    
+    def __init__(self, candidate_factor: int = 20, min_candidates: int = 2000):
+        self.candidate_factor = candidate_factor
+        self.min_candidates = min_candidates
+    
+    def candidates(self, state, retriever, skills, user_vector, top_k):
+        overlap = skill_overlap(state.catalog, skills, "required")
+        positions = np.flatnonzero(overlap)
+        if len(positions) < top_k:
+            return None
+        
+        limit = max(top_k * self.candidate_factor, self.min_candidates)
+        if len(positions) > limit:
+            positions = np.sort(positions[np.argpartition(-overlap[positions], limit - 1)[:limit]])
+        return positions
+
+def skill_overlap(catalog: CareerCatalog, skills: Iterable[str], relation: str) -> np.ndarray:
+    """Number of the given skills each career lists under relation (required or recommended)"""
+    indptr = getattr(catalog, f"{relation}_by_skill_indptr")
+    by_skill = getattr(catalog, f"{relation}_by_skill")
+    counts = np.zeros(len(catalog), dtype=np.int32)
+    for skill in skills:
+        skill_id = catalog.skill_lookup.get(skill)
+        if skill_id is not None:
+            # A career lists each skill once, so the positions are distinct
+            counts[by_skill[indptr[skill_id]:indptr[skill_id + 1]]] += 1
+    return counts
+
+# Scorers selectable by name, per deployment through CAREER_SCORER or per request
+SCORERS = {
+    "overlap": OverlapScorer,
+    "tfidf": TfidfScorer,
+    "hybrid": HybridScorer,
+}
+
+def make_scorer(name: str) -> Scorer:
+    """Build a scorer by registry name"""
+    if name not in SCORERS:
+        raise ValueError(f"Unknown scorer {name!r}, expected one of {sorted(SCORERS)}")
+    return SCORERS[name]()
 
 class CareerRecommender:
-    def __init__(self):
-        self.vectorizer = TfidfVectorizer(stop_words='english', max_features=1000)
-        self.career_data = self.load_career_data()
-        self.fit_model()
+    def __init__(self, career_data: Optional[Union[CareerCatalog, List[Dict]]] = None,
+                 cache_size: Optional[int] = None, cache_ttl: Optional[float] = None,
+                 model_path: Optional[str] = None, retriever: Optional[CandidateRetriever] = None,
+                 refresh_delay: Optional[float] = None, refit_oov_ratio: float = 0.2,
+                 scorer: Optional[Scorer] = None, skill_normalizer: Optional[SkillNormalizer] = None,
+                 topk_table_path: Optional[str] = None, skill_graph: Optional[SkillGraph] = None):
+        self.retriever = retriever or make_retriever(os.environ.get("CAREER_RETRIEVER", "exact"))
+        self.scorer = scorer or make_scorer(os.environ.get("CAREER_SCORER", "tfidf"))
+        self._scorers = {name: cls() for name, cls in SCORERS.items()}
+        self.skill_normalizer = skill_normalizer or SkillNormalizer()
+        self.skill_graph = skill_graph or load_skill_graph(os.environ.get("CAREER_SKILL_GRAPH_PATH", DEFAULT_GRAPH_PATH))
+        self.cache = TTLCache(
+            max_entries=cache_size if cache_size is not None else int(os.environ.get("CAREER_CACHE_MAX_ENTRIES", 1024)),
+            ttl=cache_ttl if cache_ttl is not None else float(os.environ.get("CAREER_CACHE_TTL", 300))
+        )
+        
+        # Deferred IDF re-weighting and vocabulary refits after incremental catalog updates
+        self.refresh_delay = refresh_delay if refresh_delay is not None else float(os.environ.get("CAREER_REFRESH_DELAY", 5))
+        self.refit_oov_ratio = refit_oov_ratio
+        self._init_locks()
+        
+        # Precomputed answers for common profiles, revalidated or rebuilt in the background on every model swap
+        self.topk_table_path = topk_table_path if topk_table_path is not None else os.environ.get("CAREER_TOPK_TABLE", "")
+        self.topk_table: Optional[TopKTable] = None
+        
+        self.state: Optional[ModelState] = None
+        catalog = as_catalog(career_data) if career_data is not None else self.load_career_data()
+        
+        # Prefer a saved artifact fitted on this exact catalog over refitting
+        model_path = model_path if model_path is not None else os.environ.get("CAREER_MODEL_ARTIFACT", "")
+        if not (model_path and self.load_artifact(model_path, catalog)):
+            if model_path:
+                logger.warning("Model artifact %s is missing or stale, refitting", model_path)
+            self.fit_model(catalog)
     
-    def load_career_data(self) -> List[Dict]:
-        """Load career data from database"""
-        return [
-            {
-                "id": 1,
-                "title": "Data Scientist",
-                "category": "Technology",
-                "description": "Analyze complex data to help organizations make better decisions using statistical models and machine learning algorithms.",
-                "required_skills": ["python", "machine learning", "sql", "statistics", "data analysis", "pandas", "numpy"],
-                "recommended_skills": ["deep learning", "cloud computing", "big data", "docker", "kubernetes"],
-                "average_salary": "$120,000 - $160,000",
-                "growth_rate": "22% (Much faster than average)",
-                "experience_needed": "3-5 years",
-                "education": "Master's in Computer Science/Statistics/Mathematics",
-                "companies": ["Google", "Microsoft", "Amazon", "Facebook", "Netflix"],
-                "learning_path": ["Python Basics", "Statistics", "ML Algorithms", "Deep Learning", "MLOps"],
-                "job_market": "High demand with 31% projected growth",
-                "match_score": 0
-            },
-            {
-                "id": 2,
-                "title": "Machine Learning Engineer",
-                "category": "Technology",
-                "description": "Design, build, and deploy machine learning models and systems for production environments.",
-                "required_skills": ["python", "machine learning", "deep learning", "tensorflow", "pytorch", "docker", "aws"],
-                "recommended_skills": ["kubernetes", "mlops", "ci/cd", "apache spark", "hadoop"],
-                "average_salary": "$140,000 - $180,000",
-                "growth_rate": "28% (Much faster than average)",
-                "experience_needed": "4-6 years",
-                "education": "Bachelor's/Master's in Computer Science/AI",
-                "companies": ["Tesla", "OpenAI", "NVIDIA", "Uber", "Airbnb"],
-                "learning_path": ["ML Fundamentals", "Deep Learning", "Cloud Platforms", "MLOps", "System Design"],
-                "job_market": "Very high demand with AI boom",
-                "match_score": 0
-            },
-            {
-                "id": 3,
-                "title": "Frontend Developer",
-                "category": "Technology",
-                "description": "Build responsive and interactive user interfaces for web applications using modern frameworks.",
-                "required_skills": ["javascript", "react", "html", "css", "typescript", "redux"],
-                "recommended_skills": ["next.js", "graphql", "webpack", "jest", "cypress"],
-                "average_salary": "$85,000 - $130,000",
-                "growth_rate": "13% (Faster than average)",
-                "experience_needed": "2-4 years",
-                "education": "Bachelor's in Computer Science or related field",
-                "companies": ["Meta", "Spotify", "Shopify", "Stripe", "Twitter"],
-                "learning_path": ["HTML/CSS", "JavaScript", "React", "State Management", "Testing"],
-                "job_market": "Steady demand with good opportunities",
-                "match_score": 0
-            },
-            {
-                "id": 4,
-                "title": "Backend Developer",
-                "category": "Technology",
-                "description": "Develop server-side logic, databases, and APIs to support web and mobile applications.",
-                "required_skills": ["python", "java", "node.js", "sql", "mongodb", "docker", "aws"],
-                "recommended_skills": ["microservices", "kafka", "redis", "kubernetes", "graphql"],
-                "average_salary": "$95,000 - $140,000",
-                "growth_rate": "15% (Faster than average)",
-                "experience_needed": "3-5 years",
-                "education": "Bachelor's in Computer Science",
-                "companies": ["Amazon", "Google", "Microsoft", "PayPal", "LinkedIn"],
-                "learning_path": ["Backend Fundamentals", "Databases", "APIs", "Cloud Services", "DevOps"],
-                "job_market": "High demand across all industries",
-                "match_score": 0
-            },
-            {
-                "id": 5,
-                "title": "DevOps Engineer",
-                "category": "Technology",
-                "description": "Bridge development and operations teams to automate and streamline software deployment.",
-                "required_skills": ["docker", "kubernetes", "aws", "ci/cd", "linux", "python", "bash"],
-                "recommended_skills": ["terraform", "ansible", "prometheus", "grafana", "jenkins"],
-                "average_salary": "$110,000 - $150,000",
-                "growth_rate": "21% (Much faster than average)",
-                "experience_needed": "3-5 years",
-                "education": "Bachelor's in Computer Science/IT",
-                "companies": ["Netflix", "Uber", "Airbnb", "Slack", "Atlassian"],
-                "learning_path": ["Linux Basics", "Containerization", "Cloud Platforms", "CI/CD", "Monitoring"],
-                "job_market": "Very high demand with cloud adoption",
-                "match_score": 0
-            },
-            {
-                "id": 6,
-                "title": "Data Analyst",
-                "category": "Business & Analytics",
-                "description": "Interpret data and turn it into information for business decision-making through reports and visualizations.",
-                "required_skills": ["sql", "excel", "python", "tableau", "power bi", "statistics"],
-                "recommended_skills": ["r", "snowflake", "looker", "google analytics", "airflow"],
-                "average_salary": "$70,000 - $110,000",
-                "growth_rate": "18% (Much faster than average)",
-                "experience_needed": "1-3 years",
-                "education": "Bachelor's in Business/Statistics/Computer Science",
-                "companies": ["Amazon", "IBM", "Accenture", "Deloitte", "McKinsey"],
-                "learning_path": ["SQL", "Data Visualization", "Statistics", "Python", "Business Intelligence"],
-                "job_market": "High demand across all sectors",
-                "match_score": 0
-            },
-            {
-                "id": 7,
-                "title": "Cybersecurity Analyst",
-                "category": "Security",
-                "description": "Protect computer systems and networks from cyber threats and security breaches.",
-                "required_skills": ["network security", "linux", "python", "siem", "firewalls", "encryption"],
-                "recommended_skills": ["ethical hacking", "cloud security", "compliance", "threat intelligence", "soc"],
-                "average_salary": "$90,000 - $130,000",
-                "growth_rate": "33% (Much faster than average)",
-                "experience_needed": "2-4 years",
-                "education": "Bachelor's in Cybersecurity/Computer Science",
-                "companies": ["CrowdStrike", "Palo Alto Networks", "Cisco", "IBM Security", "McAfee"],
-                "learning_path": ["Networking", "Security Fundamentals", "Tools & Technologies", "Threat Analysis", "Compliance"],
-                "job_market": "Extremely high demand with increasing threats",
-                "match_score": 0
-            },
-            {
-                "id": 8,
-                "title": "Cloud Architect",
-                "category": "Cloud & Infrastructure",
-                "description": "Design and implement cloud computing strategies and solutions for organizations.",
-                "required_skills": ["aws", "azure", "gcp", "docker", "kubernetes", "terraform", "python"],
-                "recommended_skills": ["serverless", "microservices", "devsecops", "cost optimization", "multi-cloud"],
-                "average_salary": "$130,000 - $190,000",
-                "growth_rate": "25% (Much faster than average)",
-                "experience_needed": "5-8 years",
-                "education": "Bachelor's/Master's in Computer Science",
-                "companies": ["Amazon Web Services", "Microsoft Azure", "Google Cloud", "Oracle", "VMware"],
-                "learning_path": ["Cloud Fundamentals", "Infrastructure as Code", "Networking", "Security", "Architecture Patterns"],
-                "job_market": "Very high demand with cloud migration",
-                "match_score": 0
-            }
-        ]
+    def _init_locks(self):
+        self._write_lock = threading.RLock()
+        self._refresh_lock = threading.Lock()
+        self._refresh_thread: Optional[threading.Thread] = None
+        self._refresh_pending = False
+        self._new_tokens = 0
+        self._oov_tokens = 0
+        self._topk_thread: Optional[threading.Thread] = None
+        self._topk_pending = False
     
-    def fit_model(self):
+    def __getstate__(self):
+        state = dict(self.__dict__)
+        for name in ("_write_lock", "_refresh_lock", "_refresh_thread", "_topk_thread"):
+            del state[name]
+        return state
+    
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._init_locks()
+    
+    def load_career_data(self) -> CareerCatalog:
+        """Load the career catalog named by CAREER_CATALOG_PATH, or the bundled one"""
+        return load_catalog(os.environ.get("CAREER_CATALOG_PATH", DEFAULT_CATALOG_PATH))
+    
+    @property
+    def catalog(self) -> CareerCatalog:
+        return self.state.catalog
+    
+    @property
+    def career_data(self) -> CareerCatalog:
+        """The career catalog, under the name callers used before CareerCatalog existed"""
+        return self.state.catalog
+    
+    @property
+    def vectorizer(self) -> "TfidfVectorizer":
+        return self.state.vectorizer
+    
+    @property
+    def tfidf_matrix(self):
+        return self.state.tfidf_matrix
+    
+    @property
+    def model_version(self) -> int:
+        return self.state.version
+    
+    def fit_model(self, catalog: Optional[CareerCatalog] = None):
         """Train the recommendation model"""
-        all_texts = []
-        for career in self.career_data:
-            text = " ".join(career["required_skills"]) + " " + career["description"] + " " + career["category"]
-            all_texts.append(text)
+        from sklearn.feature_extraction.text import CountVectorizer
         
-        self.tfidf_matrix = self.vectorizer.fit_transform(all_texts)
+        with self._write_lock:
+            catalog = catalog if catalog is not None else self.catalog
+            all_texts = [career_text(career) for career in catalog]
+            
+            counter = CountVectorizer(**VECTORIZER_PARAMS)
+            term_counts = counter.fit_transform(all_texts).tocsr()
+            idf = inverse_document_frequency(term_counts)
+            tfidf_matrix = weight_term_counts(term_counts, idf)
+            
+            self._new_tokens = self._oov_tokens = 0
+            self._swap_state(catalog, make_vectorizer(counter.vocabulary_, idf), tfidf_matrix, term_counts,
+                             self.retriever.fit(tfidf_matrix))
     
-    def recommend_careers(self, user_skills: str, user_interests: str, experience_years: int = 2, education_level: str = "Bachelor's") -> List[Dict]:
-        """Recommend careers based on user profile"""
-        user_text = user_skills.lower() + " " + user_interests.lower()
+    def _swap_state(self, catalog: CareerCatalog, vectorizer: "TfidfVectorizer", tfidf_matrix, term_counts,
+                    retriever_index: Any):
+        """Publish a new model state; callers hold the write lock"""
+        version = self.state.version + 1 if self.state is not None else 1
+        self.skill_normalizer.add_skills(catalog.skills)
+        self.state = ModelState(version, catalog, vectorizer, tfidf_matrix, term_counts, retriever_index)
         
-        # Transform user input
-        user_vector = self.vectorizer.transform([user_text])
+        # Cached responses belong to the previous state; the version in every key makes stale entries unreachable
+        self.cache.clear()
         
-        # Calculate similarity
-        similarities = cosine_similarity(user_vector, self.tfidf_matrix).flatten()
+        if self.topk_table_path:
+            self._schedule_topk_refresh()
+    
+    def _schedule_topk_refresh(self):
+        """Revalidate or rebuild the top-k table for the current state in the background"""
+        with self._refresh_lock:
+            self._topk_pending = True
+            if self._topk_thread is None:
+                self._topk_thread = threading.Thread(target=self._topk_refresh_loop, name="career-topk-refresh",
+                                                     daemon=True)
+                self._topk_thread.start()
+    
+    def _topk_refresh_loop(self):
+        while True:
+            with self._refresh_lock:
+                if not self._topk_pending:
+                    self._topk_thread = None
+                    return
+                self._topk_pending = False
+            try:
+                self.refresh_topk_table()
+            except Exception:
+                logger.exception("Refreshing the top-k table at %s failed", self.topk_table_path)
+    
+    def refresh_topk_table(self):
+        """Attach the top-k table if it matches the current model, otherwise rebuild it from its profiles"""
+        state = self.state
+        table = self.topk_table or TopKTable.load(self.topk_table_path)
+        if table is None:
+            logger.warning("No top-k table at %s", self.topk_table_path)
+            return
         
-        # Adjust scores based on experience and education
-        for i, career in enumerate(self.career_data):
-            base_score = similarities[i] * 100
+        if table.fingerprint != state.fingerprint or table.scorer != self.scorer.name:
+            # Another worker sharing the file may already have rebuilt it
+            table = TopKTable.load(self.topk_table_path) or table
+        
+        if table.fingerprint == state.fingerprint and table.scorer == self.scorer.name:
+            table.version = state.version
+        else:
+            logger.info("Rebuilding the top-k table for %d profiles", len(table))
+            table = build_table(self, table.profiles, table.top_k)
+            table.save(self.topk_table_path)
+        
+        # A state swapped in meanwhile has scheduled another refresh
+        if self.state is state:
+            self.topk_table = table
+    
+    def wait_for_background(self, timeout: Optional[float] = None) -> bool:
+        """Block until deferred refreshes and top-k rebuilds have finished; False on timeout"""
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        while True:
+            with self._refresh_lock:
+                threads = [t for t in (self._refresh_thread, self._topk_thread) if t is not None]
+            if not threads:
+                return True
             
-            # Experience adjustment
-            exp_needed = career["experience_needed"]
-            min_exp = int(exp_needed.split("-")[0].split()[0])
-            exp_adjustment = min(experience_years / min_exp, 1.5) * 20
+            # A finishing thread may schedule the other one, so check again after joining
+            for thread in threads:
+                thread.join(None if deadline is None else max(deadline - time.monotonic(), 0))
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
+    
+    def compact_catalog(self):
+        """Pack the catalog's records into one buffer so forked workers share them copy-on-write"""
+        with self._write_lock:
+            state = self.state
+            catalog = state.catalog.compact()
+            if catalog is not state.catalog:
+                self._swap_state(catalog, state.vectorizer, state.tfidf_matrix, state.term_counts,
+                                 state.retriever_index)
+    
+    def add_careers(self, careers: List[Dict]):
+        """Add new careers without refitting the vectorizer"""
+        ids = [career["id"] for career in careers]
+        if len(set(ids)) != len(ids):
+            raise ValueError("Career ids must be unique")
+        
+        with self._write_lock:
+            for career_id in ids:
+                if self.catalog.position(career_id) is not None:
+                    raise ValueError(f"Career {career_id} already exists")
+            self._apply_changes(careers, [])
+    
+    def update_career(self, career: Dict):
+        """Replace an existing career without refitting the vectorizer"""
+        with self._write_lock:
+            if self.catalog.position(career["id"]) is None:
+                raise ValueError(f"Career {career['id']} not found")
+            self._apply_changes([career], [])
+    
+    def remove_career(self, career_id: int):
+        """Remove a career without refitting the vectorizer"""
+        with self._write_lock:
+            if self.catalog.position(career_id) is None:
+                raise ValueError(f"Career {career_id} not found")
+            self._apply_changes([], [career_id])
+    
+    def _apply_changes(self, upserts: List[Dict], removed_ids: Iterable[int]):
+        """Update catalog, term counts, TF-IDF rows and indexes in place of a refit"""
+        from sklearn.feature_extraction.text import CountVectorizer
+        
+        state = self.state
+        catalog, keep = state.catalog.apply_changes(upserts, removed_ids)
+        
+        # New rows are weighted with the current IDF; re-weighting every row is deferred to refresh()
+        texts = [career_text(career) for career in upserts]
+        counter = CountVectorizer(vocabulary=state.vectorizer.vocabulary_, **VECTORIZER_PARAMS)
+        new_counts = counter.transform(texts).tocsr()
+        new_rows = weight_term_counts(new_counts, state.vectorizer.idf_)
+        
+        term_counts = vstack([state.term_counts[keep], new_counts], format="csr")
+        tfidf_matrix = vstack([state.tfidf_matrix[keep], new_rows], format="csr")
+        retriever_index = self.retriever.update(state.retriever_index, keep, new_rows)
+        
+        # Terms outside the fitted vocabulary only enter the model through a full refit
+        analyzer = counter.build_analyzer()
+        for text in texts:
+            tokens = analyzer(text)
+            self._new_tokens += len(tokens)
+            self._oov_tokens += sum(token not in counter.vocabulary_ for token in tokens)
+        
+        self._swap_state(catalog, state.vectorizer, tfidf_matrix, term_counts, retriever_index)
+        self._schedule_refresh()
+    
+    def _schedule_refresh(self):
+        """Batch deferred work into one background refresh after refresh_delay seconds"""
+        with self._refresh_lock:
+            self._refresh_pending = True
+            if self._refresh_thread is None:
+                self._refresh_thread = threading.Thread(target=self._refresh_loop, name="career-model-refresh",
+                                                        daemon=True)
+                self._refresh_thread.start()
+    
+    def _refresh_loop(self):
+        try:
+            while True:
+                time.sleep(self.refresh_delay)
+                try:
+                    self.refresh()
+                except Exception:
+                    logger.exception("Background model refresh failed")
+                with self._refresh_lock:
+                    if not self._refresh_pending:
+                        self._refresh_thread = None
+                        return
+        finally:
+            # A thread that dies anyway must not keep later updates from scheduling a new one
+            with self._refresh_lock:
+                if self._refresh_thread is threading.current_thread():
+                    self._refresh_thread = None
+    
+    def refresh(self):
+        """Apply work deferred by incremental updates: fresh IDF weights, retriever refit, vocabulary refit"""
+        with self._write_lock:
+            with self._refresh_lock:
+                if not self._refresh_pending:
+                    return
+                self._refresh_pending = False
             
-            # Education adjustment
-            education_match = 1.0 if education_level in career["education"] else 0.8
+            if self._oov_tokens > self.refit_oov_ratio * self._new_tokens:
+                self.fit_model()
+                return
             
-            # Final score
-            career["match_score"] = round(base_score * education_match + exp_adjustment, 2)
-            career["match_score"] = min(career["match_score"], 99.9)  # Cap at 99.9
+            state = self.state
+            idf = inverse_document_frequency(state.term_counts)
+            tfidf_matrix = weight_term_counts(state.term_counts, idf)
+            self._swap_state(state.catalog, make_vectorizer(state.vectorizer.vocabulary_, idf), tfidf_matrix,
+                             state.term_counts, self.retriever.fit(tfidf_matrix))
+    
+    def get_career(self, career_id: int) -> Optional[Dict]:
+        """Look up a career by id"""
+        return self.catalog.get(career_id)
+    
+    def canonical_skill(self, skill: str) -> str:
+        """Canonical name of a skill or alias, or the skill as typed when it is not exactly one known skill"""
+        canonical = self.skill_normalizer.normalize(skill)
+        return canonical[0] if len(canonical) == 1 else skill.lower().strip()
+    
+    def careers_with_skill(self, skill: str) -> List[Dict]:
+        """Careers that require or recommend a skill"""
+        catalog = self.catalog
+        return [
+            dict(catalog[position], relation=relation)
+            for position, relation in catalog.careers_with_skill(self.canonical_skill(skill))
+        ]
+    
+    @staticmethod
+    def top_k_indices(scores: np.ndarray, k: int) -> np.ndarray:
+        """Indices of the k highest scores, ties broken by catalog order"""
+        if k >= len(scores):
+            return np.argsort(-scores, kind="stable")
         
-        # Sort by match score
-        sorted_careers = sorted(self.career_data, key=lambda x: x["match_score"], reverse=True)
+        # Partition first, then sort only the candidates that can reach the top k
+        threshold = scores[np.argpartition(-scores, k - 1)[k - 1]]
+        candidates = np.flatnonzero(scores >= threshold)
         
-        return sorted_careers[:5]
+        return candidates[np.argsort(-scores[candidates], kind="stable")][:k]
+    
+    def get_scorer(self, name: Optional[str] = None) -> Scorer:
+        """The scorer registered under name, or the deployment default"""
+        if name is None or name == self.scorer.name:
+            return self.scorer
+        if name not in self._scorers:
+            raise ValueError(f"Unknown scorer {name!r}, expected one of {sorted(SCORERS)}")
+        return self._scorers[name]
+    
+    def recommend_careers(self, user_skills: str, user_interests: str, experience_years: int = 2, education_level: str = "Bachelor's", top_k: int = 5,
+                          scorer: Optional[str] = None) -> List[Recommendation]:
+        """Recommend careers based on user profile, with the named scorer or the default one"""
+        state = self.state
+        career_scorer = self.get_scorer(scorer)
+        skills = self.skill_normalizer.normalize(user_skills)
+        text = profile_text(user_skills, skills, user_interests)
+        
+        # Common profiles are answered from the precomputed table
+        if career_scorer is self.scorer:
+            precomputed = self._precomputed(state, skills, text, experience_years, education_level, top_k)
+            if precomputed is not None:
+                return precomputed
+        
+        cache_key = ("recommend", state.version, type(career_scorer).__name__, skills, text, experience_years,
+                     education_level, top_k)
+        
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            return list(cached)
+        
+        scores, positions = career_scorer.score(state, self.retriever, skills, text, experience_years,
+                                                education_level, top_k)
+        
+        with metrics.stage("sort"):
+            top = self.top_k_indices(scores, top_k)
+            top_scores = scores[top]
+            if positions is not None:
+                top = positions[top]
+        
+        recommendations = [Recommendation(state.catalog, i, float(score)) for i, score in zip(top, top_scores)]
+        self.cache.put(cache_key, tuple(recommendations))
+        
+        return recommendations
+    
+    def _precomputed(self, state: ModelState, skills: Tuple[str, ...], text: str, experience_years: float,
+                     education_level: str, top_k: int) -> Optional[List[Recommendation]]:
+        """Recommendations from the top-k table, or None when it cannot answer for this state"""
+        table = self.topk_table
+        if table is None:
+            return None
+        found = table.lookup(state.version, skills, text, experience_years, education_level, top_k)
+        if found is None:
+            return None
+        return [Recommendation(state.catalog, int(i), float(score)) for i, score in zip(*found)]
+    
+    def recommend_careers_batch(self, profiles: List[Dict[str, Any]], top_k: int = 5,
+                                scorer: Optional[str] = None) -> List[List[Recommendation]]:
+        """Recommend careers for many user profiles in one vectorized pass"""
+        if not profiles:
+            return []
+        
+        # Only exact TF-IDF scoring has a vectorized batch path; other scorers score profile by profile
+        if type(self.get_scorer(scorer)) is not TfidfScorer:
+            return [
+                self.recommend_careers(str(p.get("skills", "")), str(p.get("interests", "")),
+                                       p.get("experience_years", 2), p.get("education_level", "Bachelor's"),
+                                       top_k=top_k, scorer=scorer)
+                for p in profiles
+            ]
+        
+        state = self.state
+        
+        # Profiles in the precomputed table skip scoring; the rest are scored together
+        if self.topk_table is not None and self.get_scorer(scorer) is self.scorer:
+            precomputed = []
+            for p in profiles:
+                skills = self.skill_normalizer.normalize(str(p.get("skills", "")))
+                text = profile_text(str(p.get("skills", "")), skills, str(p.get("interests", "")))
+                precomputed.append(self._precomputed(state, skills, text, float(p.get("experience_years", 2)),
+                                                     p.get("education_level", "Bachelor's"), top_k))
+            if any(found is not None for found in precomputed):
+                misses = [p for p, found in zip(profiles, precomputed) if found is None]
+                scored = iter(self._score_batch(state, misses, top_k) if misses else [])
+                return [found if found is not None else next(scored) for found in precomputed]
+        
+        return self._score_batch(state, profiles, top_k)
+    
+    def _score_batch(self, state: ModelState, profiles: List[Dict[str, Any]], top_k: int) -> List[List[Recommendation]]:
+        """Exact TF-IDF recommendations for many profiles in one vectorized pass"""
+        user_texts = [
+            profile_text(str(p.get("skills", "")), self.skill_normalizer.normalize(str(p.get("skills", ""))),
+                         str(p.get("interests", "")))
+            for p in profiles
+        ]
+        experience_years = np.array([float(p.get("experience_years", 2)) for p in profiles])
+        education_levels = [p.get("education_level", "Bachelor's") for p in profiles]
+        
+        # Transform every profile at once
+        user_matrix = state.vectorizer.transform(user_texts)
+        
+        # Education adjustment, resolved once per distinct education level
+        levels, level_index = np.unique(education_levels, return_inverse=True)
+        level_match = np.vstack([state.education_match(level) for level in levels])
+        level_index = level_index.ravel()
+        
+        # Score blocks of profiles so the dense profiles x careers arrays stay bounded for large catalogs
+        block_size = max(1, BATCH_BLOCK_ELEMENTS // max(len(state.catalog), 1))
+        results = []
+        for start in range(0, len(profiles), block_size):
+            block = slice(start, start + block_size)
+            similarities = state.similarity(user_matrix[block])
+            
+            # Experience adjustment, broadcast over profiles x careers
+            exp_adjustment = np.minimum(experience_years[block, None] / state.catalog.min_experience[None, :], 1.5) * 20
+            
+            # Final scores, capped at 99.9
+            scores = np.minimum(np.round(similarities * 100 * level_match[level_index[block]] + exp_adjustment, 2), 99.9)
+            
+            results.extend(
+                [Recommendation(state.catalog, j, float(row[j])) for j in self.top_k_indices(row, top_k)]
+                for row in scores
+            )
+        
+        return results
     
     def get_skill_gap_analysis(self, user_skills: List[str], target_career_id: int) -> Dict:
         """Analyze skill gaps for a target career"""
-        target_career = next((c for c in self.career_data if c["id"] == target_career_id), None)
+        # One snapshot, so a concurrent swap cannot cache one catalog's analysis under another's version
+        state = self.state
+        catalog = state.catalog
+        skills = self.skill_normalizer.normalize(user_skills)
+        cache_key = ("skill_gap", state.version, skills, target_career_id)
         
-        if not target_career:
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            return dict(cached)
+        
+        position = catalog.position(target_career_id)
+        
+        if position is None:
             return {"error": "Career not found"}
         
-        user_skill_set = set([skill.lower().strip() for skill in user_skills])
-        required_skills = set([skill.lower() for skill in target_career["required_skills"]])
-        recommended_skills = set([skill.lower() for skill in target_career["recommended_skills"]])
+        with metrics.stage("skill_gap"):
+            analysis = self.skill_gap(catalog, position, catalog.skill_ids(skills), skills)
+        self.cache.put(cache_key, analysis)
         
-        missing_required = list(required_skills - user_skill_set)
-        missing_recommended = list(recommended_skills - user_skill_set)
-        existing_skills = list(user_skill_set & (required_skills | recommended_skills))
+        return dict(analysis)
+    
+    def get_top_skill_gaps(self, user_skills: List[str], user_interests: str = "", experience_years: int = 2,
+                           education_level: str = "Bachelor's", top_n: int = 5,
+                           scorer: Optional[str] = None) -> List[Dict]:
+        """Analyze skill gaps against the top N recommended careers in one pass"""
+        # Ranked from the skills as typed, like recommend_careers; the normalized ones are for the gaps
+        recommendations = self.recommend_careers(", ".join(user_skills), user_interests, experience_years,
+                                                 education_level, top_k=top_n, scorer=scorer)
+        skills = self.skill_normalizer.normalize(user_skills)
         
-        match_percentage = len(user_skill_set & required_skills) / len(required_skills) * 100
+        # Every recommendation references the same catalog, so the user's skills are interned once
+        user_skill_ids = recommendations[0]._catalog.skill_ids(skills) if recommendations else frozenset()
+        return [
+            dict(self.skill_gap(r._catalog, r._index, user_skill_ids, skills), career_id=r.career_id,
+                 match_score=r.match_score)
+            for r in recommendations
+        ]
+    
+    def get_learning_plan(self, user_skills: List[str], target_career_ids: Optional[List[int]] = None,
+                          user_interests: str = "", experience_years: int = 2, education_level: str = "Bachelor's",
+                          top_n: int = 5, scorer: Optional[str] = None, include_recommended: bool = False) -> Dict:
+        """One learning plan covering the skill gaps of the target careers, by default the top N recommendations"""
+        skills = self.skill_normalizer.normalize(user_skills)
+        if target_career_ids is None:
+            targets = [
+                (r._catalog, r._index)
+                for r in self.recommend_careers(", ".join(user_skills), user_interests, experience_years,
+                                                education_level, top_k=top_n, scorer=scorer)
+            ]
+        else:
+            catalog = self.state.catalog
+            targets = []
+            for career_id in dict.fromkeys(target_career_ids):
+                position = catalog.position(career_id)
+                if position is None:
+                    return {"error": f"Career {career_id} not found"}
+                targets.append((catalog, position))
+        
+        with metrics.stage("learning_plan"):
+            relations = ("required", "recommended") if include_recommended else ("required",)
+            careers, goals = [], {}
+            for catalog, position in targets:
+                user_skill_ids = catalog.skill_ids(skills)
+                career = catalog[position]
+                missing = [
+                    catalog.skills[i]
+                    for relation in relations for i in catalog.skill_id_list(relation, position)
+                    if i not in user_skill_ids
+                ]
+                goals[career["id"]] = list(dict.fromkeys(missing))
+                careers.append({
+                    "career_id": career["id"],
+                    "title": career["title"],
+                    "missing_skills": goals[career["id"]]
+                })
+            
+            plan = self.skill_graph.plan(goals, skills)
+            for career in careers:
+                career["effort_weeks"] = plan["goals"][career["career_id"]]["effort_weeks"]
+        
+        return {
+            "careers": careers,
+            "steps": plan["steps"],
+            "effort_weeks": plan["effort_weeks"],
+            "critical_path_weeks": plan["critical_path_weeks"],
+            "time_to_proficiency": plan["time_to_proficiency"],
+        }
+    
+    def skill_gap(self, catalog: CareerCatalog, position: int, user_skill_ids: frozenset,
+                  user_skills: Iterable[str] = ()) -> Dict:
+        """Skill gap of a user, given as interned skill ids and skill names, against the career at a catalog position"""
+        target_career = catalog[position]
+        skills = catalog.skills
+        required_ids = catalog.skill_id_list("required", position)
+        recommended_ids = catalog.skill_id_list("recommended", position)
+        
+        missing_required = [skills[i] for i in required_ids if i not in user_skill_ids]
+        missing_recommended = [skills[i] for i in recommended_ids if i not in user_skill_ids]
+        existing_skills = [skills[i] for i in dict.fromkeys(required_ids + recommended_ids) if i in user_skill_ids]
+        
+        matched_required = len(required_ids) - len(missing_required)
+        match_percentage = matched_required / len(required_ids) * 100 if required_ids else 0.0
+        
+        # Prerequisites the user lacks are part of the plan and of the effort estimate
+        plan = self.skill_graph.plan({target_career["id"]: missing_required + missing_recommended}, user_skills)
         
         return {
             "target_career": target_career["title"],
@@ -209,26 +902,36 @@ class CareerRecommender:
             "missing_required": missing_required,
             "missing_recommended": missing_recommended,
             "learning_path": target_career["learning_path"],
-            "time_to_proficiency": self.calculate_time_to_proficiency(len(missing_required), len(missing_recommended))
+            "learning_plan": [step["skill"] for step in plan["steps"]],
+            "effort_weeks": plan["effort_weeks"],
+            "time_to_proficiency": plan["time_to_proficiency"]
         }
     
-    def calculate_time_to_proficiency(self, missing_req: int, missing_rec: int) -> str:
-        """Estimate time needed to learn missing skills"""
-        total_missing = missing_req + missing_rec
-        if total_missing <= 2:
-            return "1-3 months"
-        elif total_missing <= 5:
-            return "3-6 months"
-        elif total_missing <= 8:
-            return "6-12 months"
-        else:
-            return "1-2 years"
+    def save_artifact(self, path: str):
+        """Save the fitted vectorizer and TF-IDF matrix as a versioned artifact directory"""
+        artifact.save_artifact(self.state, path)
+    
+    def load_artifact(self, path: str, catalog: Optional[CareerCatalog] = None) -> bool:
+        """Load a saved artifact if it was fitted on the catalog (by default the current one)"""
+        catalog = catalog if catalog is not None else self.catalog
+        loaded = artifact.load_artifact(path, catalog, VECTORIZER_PARAMS)
+        if loaded is None:
+            return False
+        
+        with self._write_lock:
+            self._swap_state(catalog, make_vectorizer(loaded["vocabulary"], loaded["idf"]), loaded["tfidf_matrix"],
+                             loaded["term_counts"], self.retriever.fit(loaded["tfidf_matrix"]))
+        return True
     
     def save_model(self, filepath: str = "career_recommender.joblib"):
         """Save trained model to file"""
+        import joblib
+        
         joblib.dump(self, filepath)
     
     @staticmethod
     def load_model(filepath: str = "career_recommender.joblib"):
         """Load model from file"""
-        return joblib.load(filepath)
\ No newline at end of file
+        import joblib
+        
+        return joblib.load(filepath)
@@ -0,0 +1,218 @@
+"""Precomputed top-k recommendation tables for common profiles
+
+Onboarding presets and the frontend's default skills account for a large
+share of requests. A table stores the top-k recommendations of each of these
+profiles for every experience bucket and education level, so
+recommend_careers answers them with one dict lookup and one array read.
+
+Experience buckets are whole years from 0 to ceil(1.5 * the largest minimum
+experience). Past that, the experience adjustment is capped for every
+career, so a table answer is identical to live scoring for any whole number
+of years. Profiles the table does not know, fractional years, free-text
+education levels, other scorers or other top_k values are scored live.
+
+A table directory holds meta.json, with the profiles and the fingerprint of
+the fitted model, plus positions.npy and scores.npy. Tables are loaded
+memory-mapped. When the model's catalog or weights change, the recommender
+rebuilds its table in the background from the stored profile list.
+
+Build one from the backend directory with:
+
+    python -m precompute --profiles data/common_profiles.json --output data/careers.topk
+    python -m precompute --log requests.ndjson --most-common 1000 --output data/careers.topk
+"""
+import argparse
+import json
+import math
+import os
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from catalog import EDUCATION_LEVELS
+from skills import profile_text
+
+# Version 2 keys profiles by their vectorized text (skills.profile_text) rather than by interests alone
+TABLE_FORMAT_VERSION = 2
+
+# (canonical skills, vectorized text)
+ProfileKey = Tuple[Tuple[str, ...], str]
+
+
+class TopKTable:
+    """Top-k career positions and scores of known profiles, per experience bucket and education level"""
+
+    def __init__(self, profiles: List[ProfileKey], positions: np.ndarray, scores: np.ndarray, meta: Dict):
+        self.profiles = profiles
+        self.positions = positions
+        self.scores = scores
+        self.meta = meta
+        self.fingerprint = meta["model_fingerprint"]
+        self.scorer = meta["scorer"]
+        self.top_k = meta["top_k"]
+        self.max_experience = meta["max_experience"]
+        self.education_index = {level: i for i, level in enumerate(meta["education_levels"])}
+        self.index = {profile: row for row, profile in enumerate(profiles)}
+
+        # Version of the model state the table was validated against; lookups for any other state miss
+        self.version: Optional[int] = None
+
+    def __len__(self) -> int:
+        return len(self.profiles)
+
+    def lookup(self, version: int, skills: Tuple[str, ...], text: str, experience_years, education_level: str,
+               top_k: int) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """Positions and scores of the top careers, or None when the table cannot answer exactly"""
+        if version != self.version or top_k != self.top_k:
+            return None
+        row = self.index.get((skills, text))
+        level = self.education_index.get(education_level)
+        if row is None or level is None:
+            return None
+        if isinstance(experience_years, float) and not experience_years.is_integer():
+            return None
+        if experience_years < 0:
+            return None
+
+        bucket = min(int(experience_years), self.max_experience)
+        positions = self.positions[row, bucket, level]
+        found = positions >= 0
+        return positions[found], self.scores[row, bucket, level][found]
+
+    def save(self, path: str):
+        os.makedirs(path, exist_ok=True)
+        meta_path = os.path.join(path, "meta.json")
+        if os.path.exists(meta_path):
+            os.remove(meta_path)
+
+        # Each file is replaced atomically, so workers sharing the directory never read a torn array;
+        # meta.json is written last so a partially written table is never considered valid
+        for name, array in (("positions.npy", self.positions), ("scores.npy", self.scores)):
+            _replace(os.path.join(path, name), lambda f: np.save(f, array))
+        _replace(meta_path, lambda f: f.write(json.dumps(
+            dict(self.meta, profiles=[[list(skills), text] for skills, text in self.profiles]),
+            ensure_ascii=False).encode("utf-8")))
+
+    @classmethod
+    def load(cls, path: str) -> Optional["TopKTable"]:
+        """The table stored at path, or None when it is missing or of another format"""
+        try:
+            with open(os.path.join(path, "meta.json"), encoding="utf-8") as f:
+                meta = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if meta.get("format_version") != TABLE_FORMAT_VERSION:
+            return None
+
+        profiles = [(tuple(skills), text) for skills, text in meta.pop("profiles")]
+        positions = np.load(os.path.join(path, "positions.npy"), mmap_mode="r")
+        scores = np.load(os.path.join(path, "scores.npy"), mmap_mode="r")
+        return cls(profiles, positions, scores, meta)
+
+
+def _replace(path: str, write):
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as f:
+        write(f)
+    os.replace(tmp_path, path)
+
+
+def build_table(recommender, profiles: Iterable[ProfileKey], top_k: int = 5) -> TopKTable:
+    """Score every profile in every experience bucket and education level with the recommender's scorer"""
+    from ml_model import TfidfScorer
+
+    state = recommender.state
+    scorer = recommender.scorer
+    catalog = state.catalog
+    profiles = list(dict.fromkeys(profiles))
+    max_experience = int(math.ceil(1.5 * catalog.min_experience.max())) if len(catalog) else 0
+
+    shape = (len(profiles), max_experience + 1, len(EDUCATION_LEVELS), top_k)
+    positions = np.full(shape, -1, dtype=np.int32)
+    scores = np.zeros(shape, dtype=np.float64)
+
+    for row, (skills, text) in enumerate(profiles):
+        # Similarity does not depend on experience or education, so TF-IDF scorers compute it once per profile
+        if isinstance(scorer, TfidfScorer):
+            similarities, candidates = scorer.similarities(state, recommender.retriever, skills, text, top_k)
+
+        for bucket in range(max_experience + 1):
+            for level, education_level in enumerate(EDUCATION_LEVELS):
+                if isinstance(scorer, TfidfScorer):
+                    career_scores = state.score_careers(similarities, bucket, education_level, candidates)
+                else:
+                    career_scores, candidates = scorer.score(state, recommender.retriever, skills, text, bucket,
+                                                             education_level, top_k)
+
+                top = recommender.top_k_indices(career_scores, top_k)
+                positions[row, bucket, level, :len(top)] = top if candidates is None else candidates[top]
+                scores[row, bucket, level, :len(top)] = career_scores[top]
+
+    meta = {
+        "format_version": TABLE_FORMAT_VERSION,
+        "model_fingerprint": state.fingerprint,
+        "catalog_fingerprint": catalog.fingerprint,
+        "scorer": scorer.name,
+        "top_k": top_k,
+        "max_experience": max_experience,
+        "education_levels": EDUCATION_LEVELS,
+    }
+    table = TopKTable(profiles, positions, scores, meta)
+    table.version = state.version
+    return table
+
+
+def read_profiles(path: str) -> List[Dict]:
+    """Profiles from a JSON list or an NDJSON file"""
+    with open(path, encoding="utf-8") as f:
+        text = f.read()
+    try:
+        profiles = json.loads(text)
+    except ValueError:
+        profiles = [json.loads(line) for line in text.splitlines() if line.strip()]
+    return profiles if isinstance(profiles, list) else [profiles]
+
+
+def profile_keys(recommender, profiles: Iterable[Dict]) -> List[ProfileKey]:
+    """(canonical skills, vectorized text) keys of profiles, as recommend_careers builds them"""
+    keys = []
+    for p in profiles:
+        skills = recommender.skill_normalizer.normalize(str(p.get("skills", "")))
+        keys.append((skills, profile_text(str(p.get("skills", "")), skills, str(p.get("interests", "")))))
+    return keys
+
+
+def most_common_profiles(keys: Iterable[ProfileKey], n: int) -> List[ProfileKey]:
+    """The n most frequent profile keys of a request log"""
+    return [key for key, _ in Counter(keys).most_common(n)]
+
+
+def main():
+    from catalog import DEFAULT_CATALOG_PATH, load_catalog
+    from ml_model import CareerRecommender
+
+    parser = argparse.ArgumentParser(description="Precompute top-k recommendations for common profiles")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--profiles", help="JSON list or NDJSON of profiles to precompute")
+    source.add_argument("--log", help="NDJSON request log to mine for the most common profiles")
+    parser.add_argument("--most-common", type=int, default=1000, help="profiles to keep from --log")
+    parser.add_argument("--output", required=True, help="table directory to write")
+    parser.add_argument("--catalog", default=os.environ.get("CAREER_CATALOG_PATH", DEFAULT_CATALOG_PATH))
+    parser.add_argument("--model", default=os.environ.get("CAREER_MODEL_ARTIFACT", ""))
+    parser.add_argument("--top-k", type=int, default=5)
+    args = parser.parse_args()
+
+    recommender = CareerRecommender(load_catalog(args.catalog), cache_size=0, model_path=args.model,
+                                    topk_table_path="")
+    keys = profile_keys(recommender, read_profiles(args.profiles or args.log))
+    if args.log:
+        keys = most_common_profiles(keys, args.most_common)
+
+    table = build_table(recommender, keys, args.top_k)
+    table.save(args.output)
+    print(f"Wrote top-{args.top_k} table for {len(table)} profiles to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,177 @@
+"""Pre-rendered JSON responses for the catalog endpoints
+
+GET /api/careers and GET /api/career/<id> only change when the catalog does,
+so their bodies are serialized once per catalog and served as bytes. Every
+body carries a strong ETag (a hash of its bytes) and is sent with
+Cache-Control: no-cache. Polling clients therefore revalidate with
+If-None-Match and get an empty 304 until the catalog changes. Bodies large
+enough to benefit are gzip-compressed once for clients that accept it.
+
+Each career is rendered once as a JSON fragment. The full listing and every
+?offset=&limit= page are assembled by joining fragments, with no
+re-serialization. Pages and career details are kept in bounded LRU caches.
+Bytes match what jsonify produces (sorted keys, compact separators).
+"""
+import gzip
+import hashlib
+import json
+import threading
+from typing import Callable, Dict, List, Optional, Tuple
+
+from flask import Response
+
+from cache import TTLCache
+from catalog import CareerCatalog
+
+# Largest page a single ?limit= may ask for
+MAX_PAGE_LIMIT = 1000
+
+# Bodies smaller than this are sent uncompressed; gzip would barely shrink them
+MIN_GZIP_SIZE = 1024
+
+
+def dumps(value) -> bytes:
+    """JSON bytes as Flask's jsonify renders them outside debug mode, without the trailing newline"""
+    return json.dumps(value, sort_keys=True, separators=(",", ":")).encode("utf-8")
+
+
+def summarize_career(career: Dict) -> Dict:
+    """The short listing form of a career, with the description cut to 100 characters"""
+    description = career["description"]
+    return {
+        "id": career["id"],
+        "title": career["title"],
+        "category": career["category"],
+        "description": description[:100] + "..." if len(description) > 100 else description
+    }
+
+
+# Listing views: how each career is shown in GET /api/careers
+VIEWS: Dict[str, Callable[[Dict], Dict]] = {
+    "summary": summarize_career,
+    "full": dict,
+}
+
+
+def parse_page(args) -> Tuple[int, Optional[int]]:
+    """offset and limit query parameters; limit None means up to the end of the catalog"""
+    try:
+        offset = int(args.get("offset", 0))
+        limit = int(args["limit"]) if "limit" in args else None
+    except ValueError:
+        raise ValueError("offset and limit must be integers")
+    if offset < 0:
+        raise ValueError("offset must not be negative")
+    if limit is not None and not 1 <= limit <= MAX_PAGE_LIMIT:
+        raise ValueError(f"limit must be between 1 and {MAX_PAGE_LIMIT}")
+    return offset, limit
+
+
+class RenderedBody:
+    """A response body with its ETag and, once asked for, its gzip encoding"""
+
+    def __init__(self, body: bytes):
+        self.body = body
+        self.etag = hashlib.sha256(body).hexdigest()[:32]
+        self._gzipped: Optional[bytes] = None
+
+    @property
+    def gzipped(self) -> bytes:
+        if self._gzipped is None:
+            self._gzipped = gzip.compress(self.body, compresslevel=6, mtime=0)
+        return self._gzipped
+
+    def respond(self, request) -> Response:
+        """200 with the body, gzipped when accepted, or 304 when the client's copy is current"""
+        use_gzip = len(self.body) >= MIN_GZIP_SIZE and request.accept_encodings["gzip"] > 0
+
+        # Each encoding is a different representation, so it gets its own strong ETag
+        etag = f"{self.etag}-gzip" if use_gzip else self.etag
+        headers = {"ETag": f'"{etag}"', "Vary": "Accept-Encoding", "Cache-Control": "no-cache"}
+
+        if request.if_none_match.contains_weak(self.etag) or request.if_none_match.contains_weak(f"{self.etag}-gzip"):
+            return Response(status=304, headers=headers)
+
+        if use_gzip:
+            headers["Content-Encoding"] = "gzip"
+        return Response(self.gzipped if use_gzip else self.body, mimetype="application/json", headers=headers)
+
+
+class _RenderedCatalog:
+    """Rendered bodies of one catalog"""
+
+    def __init__(self, catalog: CareerCatalog, cache_size: int):
+        self.catalog = catalog
+        self.fragments: Dict[str, List[bytes]] = {}
+        self.listings: Dict[str, RenderedBody] = {}
+        self.pages = TTLCache(max_entries=cache_size, ttl=float("inf"))
+        self.details = TTLCache(max_entries=cache_size, ttl=float("inf"))
+        self.lock = threading.Lock()
+
+    def career_fragments(self, view: str) -> List[bytes]:
+        fragments = self.fragments.get(view)
+        if fragments is None:
+            with self.lock:
+                fragments = self.fragments.get(view)
+                if fragments is None:
+                    fragments = [dumps(VIEWS[view](career)) for career in self.catalog]
+                    self.fragments[view] = fragments
+        return fragments
+
+    def listing(self, view: str) -> RenderedBody:
+        rendered = self.listings.get(view)
+        if rendered is None:
+            body = b'{"careers":[' + b",".join(self.career_fragments(view)) + b'],"status":"success"}\n'
+            rendered = self.listings.setdefault(view, RenderedBody(body))
+        return rendered
+
+    def page(self, view: str, offset: int, limit: Optional[int]) -> RenderedBody:
+        key = (view, offset, limit)
+        rendered = self.pages.get(key)
+        if rendered is None:
+            fragments = self.career_fragments(view)
+            end = len(fragments) if limit is None else offset + limit
+            body = (b'{"careers":[' + b",".join(fragments[offset:end]) + b"]," +
+                    dumps({"limit": limit, "offset": offset, "status": "success", "total": len(fragments)})[1:] +
+                    b"\n")
+            rendered = RenderedBody(body)
+            self.pages.put(key, rendered)
+        return rendered
+
+    def detail(self, career_id: int) -> Optional[RenderedBody]:
+        rendered = self.details.get(career_id)
+        if rendered is None:
+            career = self.catalog.get(career_id)
+            if career is None:
+                return None
+            rendered = RenderedBody(dumps({"career": career, "status": "success"}) + b"\n")
+            self.details.put(career_id, rendered)
+        return rendered
+
+
+class CatalogResponses:
+    """Catalog response bodies of a recommender, re-rendered when its catalog changes"""
+
+    def __init__(self, recommender, cache_size: int = 4096):
+        self.recommender = recommender
+        self.cache_size = cache_size
+        self._rendered: Optional[_RenderedCatalog] = None
+
+    def _current(self) -> _RenderedCatalog:
+        # IDF refreshes keep the catalog object, so only catalog changes drop the rendered bodies
+        catalog = self.recommender.catalog
+        rendered = self._rendered
+        if rendered is None or rendered.catalog is not catalog:
+            rendered = self._rendered = _RenderedCatalog(catalog, self.cache_size)
+        return rendered
+
+    def careers(self, view: str = "summary", offset: int = 0, limit: Optional[int] = None) -> RenderedBody:
+        """The career listing, or one page of it"""
+        rendered = self._current()
+        if offset == 0 and limit is None:
+            return rendered.listing(view)
+        return rendered.page(view, offset, limit)
+
+    def career(self, career_id: int) -> Optional[RenderedBody]:
+        """One career's detail response, or None when it does not exist"""
+        return self._current().detail(career_id)
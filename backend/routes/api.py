@@ -1,46 +1,128 @@
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, Response, request, jsonify
 import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from ml_model import CareerRecommender
+# Shared recommender, also served by app.py and routes/asgi.py; it loads in the background
+from engine import engine_status, is_ready, recommender, start_engine
+from metrics import metrics
+from ml_model import SCORERS
+from responses import CatalogResponses, parse_page
 
 # Create blueprint
 api_bp = Blueprint('api', __name__)
 
-# Initialize recommender
-recommender = CareerRecommender()
+# Catalog endpoint bodies, rendered once per catalog
+catalog_responses = CatalogResponses(recommender)
+
+# Upper bound on profiles accepted by a single batch request
+MAX_BATCH_PROFILES = 5000
+
+# Upper bound on careers compared in a single multi-career skill-gap request
+MAX_TOP_N = 50
+
+# Endpoints served while the model is still loading
+UNGATED_ENDPOINTS = {'api.health_check', 'api.readiness_check', 'api.get_metrics'}
+
+@api_bp.before_request
+def require_engine():
+    """Start loading the recommender on the first request, and answer 503 until it has loaded"""
+    start_engine()
+    if request.endpoint in UNGATED_ENDPOINTS or is_ready():
+        return None
+    
+    status = engine_status()
+    message = 'Recommender failed to load' if status['state'] == 'failed' else 'Recommender is loading, retry shortly'
+    return jsonify({'error': message, 'model': status}), 503, {'Retry-After': '1'}
 
 @api_bp.route('/recommend', methods=['POST'])
+@metrics.instrument('recommend')
 def recommend_careers():
     """Get career recommendations based on user profile"""
     try:
-        data = request.json
+        with metrics.stage('parse'):
+            data = request.json
         
         # Validate required fields
         if not data.get('skills'):
             return jsonify({'error': 'Skills are required'}), 400
         
+        if data.get('scorer') is not None and data['scorer'] not in SCORERS:
+            return jsonify({'error': f'Unknown scorer, expected one of {sorted(SCORERS)}'}), 400
+        
         recommendations = recommender.recommend_careers(
             user_skills=data.get('skills', ''),
             user_interests=data.get('interests', ''),
             experience_years=int(data.get('experience_years', 2)),
-            education_level=data.get('education_level', "Bachelor's")
+            education_level=data.get('education_level', "Bachelor's"),
+            scorer=data.get('scorer')
         )
         
-        return jsonify({
-            'status': 'success',
-            'recommendations': recommendations
-        })
+        with metrics.stage('serialize'):
+            response = jsonify({
+                'status': 'success',
+                'recommendations': [r.to_dict() for r in recommendations]
+            })
+        
+        return response
+    
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@api_bp.route('/recommend/batch', methods=['POST'])
+@metrics.instrument('recommend_batch')
+def recommend_careers_batch():
+    """Get career recommendations for many user profiles in one request"""
+    try:
+        with metrics.stage('parse'):
+            data = request.json
+        profiles = data.get('profiles')
+        
+        # Validate required fields
+        if not isinstance(profiles, list) or not profiles:
+            return jsonify({'error': 'A non-empty list of profiles is required'}), 400
+        
+        if len(profiles) > MAX_BATCH_PROFILES:
+            return jsonify({'error': f'At most {MAX_BATCH_PROFILES} profiles are allowed per batch'}), 400
+        
+        for i, profile in enumerate(profiles):
+            if not isinstance(profile, dict) or not profile.get('skills'):
+                return jsonify({'error': f'Skills are required (profile {i})'}), 400
+        
+        if data.get('scorer') is not None and data['scorer'] not in SCORERS:
+            return jsonify({'error': f'Unknown scorer, expected one of {sorted(SCORERS)}'}), 400
+        
+        results = recommender.recommend_careers_batch([
+            {
+                'skills': p.get('skills', ''),
+                'interests': p.get('interests', ''),
+                'experience_years': int(p.get('experience_years', 2)),
+                'education_level': p.get('education_level', "Bachelor's")
+            }
+            for p in profiles
+        ], scorer=data.get('scorer'))
+        
+        with metrics.stage('serialize'):
+            response = jsonify({
+                'status': 'success',
+                'results': [
+                    {'recommendations': [r.to_dict() for r in recommendations]}
+                    for recommendations in results
+                ]
+            })
+        
+        return response
     
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
 @api_bp.route('/skill-gap', methods=['POST'])
+@metrics.instrument('skill_gap')
 def analyze_skill_gap():
     """Analyze skill gaps for a specific career"""
     try:
-        data = request.json
+        with metrics.stage('parse'):
+            data = request.json
         
         if not data.get('skills') or not data.get('target_career_id'):
             return jsonify({'error': 'Skills and target career ID are required'}), 400
@@ -52,59 +134,204 @@ def analyze_skill_gap():
             target_career_id=int(data['target_career_id'])
         )
         
-        return jsonify({
-            'status': 'success',
-            'analysis': analysis
-        })
+        with metrics.stage('serialize'):
+            response = jsonify({
+                'status': 'success',
+                'analysis': analysis
+            })
+        
+        return response
+    
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@api_bp.route('/skill-gap/top', methods=['POST'])
+@metrics.instrument('skill_gap_top')
+def analyze_top_skill_gaps():
+    """Analyze skill gaps against the top recommended careers"""
+    try:
+        with metrics.stage('parse'):
+            data = request.json
+        
+        if not data.get('skills'):
+            return jsonify({'error': 'Skills are required'}), 400
+        
+        if data.get('scorer') is not None and data['scorer'] not in SCORERS:
+            return jsonify({'error': f'Unknown scorer, expected one of {sorted(SCORERS)}'}), 400
+        
+        top_n = int(data.get('top_n', 5))
+        if not 1 <= top_n <= MAX_TOP_N:
+            return jsonify({'error': f'top_n must be between 1 and {MAX_TOP_N}'}), 400
+        
+        analyses = recommender.get_top_skill_gaps(
+            user_skills=data['skills'].split(','),
+            user_interests=data.get('interests', ''),
+            experience_years=int(data.get('experience_years', 2)),
+            education_level=data.get('education_level', "Bachelor's"),
+            top_n=top_n,
+            scorer=data.get('scorer')
+        )
+        
+        with metrics.stage('serialize'):
+            response = jsonify({
+                'status': 'success',
+                'analyses': analyses
+            })
+        
+        return response
+    
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@api_bp.route('/learning-plan', methods=['POST'])
+@metrics.instrument('learning_plan')
+def plan_learning():
+    """Ordered learning plan covering the skill gaps of target careers or the top recommended ones"""
+    try:
+        with metrics.stage('parse'):
+            data = request.json
+        
+        if not data.get('skills'):
+            return jsonify({'error': 'Skills are required'}), 400
+        
+        target_career_ids = data.get('target_career_ids')
+        if target_career_ids is not None and (not isinstance(target_career_ids, list) or
+                                              not 1 <= len(target_career_ids) <= MAX_TOP_N):
+            return jsonify({'error': f'target_career_ids must be a list of 1 to {MAX_TOP_N} career ids'}), 400
+        
+        if data.get('scorer') is not None and data['scorer'] not in SCORERS:
+            return jsonify({'error': f'Unknown scorer, expected one of {sorted(SCORERS)}'}), 400
+        
+        top_n = int(data.get('top_n', 5))
+        if not 1 <= top_n <= MAX_TOP_N:
+            return jsonify({'error': f'top_n must be between 1 and {MAX_TOP_N}'}), 400
+        
+        plan = recommender.get_learning_plan(
+            user_skills=data['skills'].split(','),
+            target_career_ids=[int(i) for i in target_career_ids] if target_career_ids is not None else None,
+            user_interests=data.get('interests', ''),
+            experience_years=int(data.get('experience_years', 2)),
+            education_level=data.get('education_level', "Bachelor's"),
+            top_n=top_n,
+            scorer=data.get('scorer'),
+            include_recommended=bool(data.get('include_recommended', False))
+        )
+        
+        if 'error' in plan:
+            return jsonify(plan), 404
+        
+        with metrics.stage('serialize'):
+            response = jsonify({
+                'status': 'success',
+                'plan': plan
+            })
+        
+        return response
     
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
 @api_bp.route('/careers', methods=['GET'])
+@metrics.instrument('careers')
 def get_all_careers():
-    """Get all available careers"""
+    """Get all available careers, or the ?offset=&limit= page of them"""
     try:
-        careers = recommender.career_data
-        simplified_careers = [
-            {
-                'id': c['id'],
-                'title': c['title'],
-                'category': c['category'],
-                'description': c['description'][:100] + '...' if len(c['description']) > 100 else c['description']
-            }
-            for c in careers
-        ]
+        with metrics.stage('parse'):
+            try:
+                offset, limit = parse_page(request.args)
+            except ValueError as e:
+                return jsonify({'error': str(e)}), 400
         
-        return jsonify({
-            'status': 'success',
-            'careers': simplified_careers
-        })
+        with metrics.stage('serialize'):
+            response = catalog_responses.careers('summary', offset, limit).respond(request)
+        
+        return response
     
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
 @api_bp.route('/career/<int:career_id>', methods=['GET'])
+@metrics.instrument('career')
 def get_career_detail(career_id):
     """Get detailed information about a specific career"""
     try:
-        career = next((c for c in recommender.career_data if c['id'] == career_id), None)
+        with metrics.stage('serialize'):
+            rendered = catalog_responses.career(career_id)
         
-        if not career:
+        if rendered is None:
             return jsonify({'error': 'Career not found'}), 404
         
+        return rendered.respond(request)
+    
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@api_bp.route('/skills/<path:skill>/careers', methods=['GET'])
+@metrics.instrument('skill_careers')
+def get_careers_with_skill(skill):
+    """Get careers that require or recommend a skill"""
+    try:
+        careers = [
+            {
+                'id': c['id'],
+                'title': c['title'],
+                'category': c['category'],
+                'relation': c['relation']
+            }
+            for c in recommender.careers_with_skill(skill)
+        ]
+        
         return jsonify({
             'status': 'success',
-            'career': career
+            'skill': recommender.canonical_skill(skill),
+            'careers': careers
         })
     
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
+@api_bp.route('/metrics', methods=['GET'])
+def get_metrics():
+    """Request counts, stage latency histograms and model size in Prometheus text format"""
+    gauges = [('career_model_ready', 'Whether the recommender has loaded', int(is_ready()))]
+    if not is_ready():
+        return Response(metrics.render(gauges), mimetype='text/plain; version=0.0.4')
+    
+    state = recommender.state
+    cache_stats = recommender.cache.stats()
+    gauges += [
+        ('career_catalog_size', 'Careers in the catalog', len(state.catalog)),
+        ('career_model_vocabulary_size', 'Terms in the TF-IDF vocabulary', len(state.vectorizer.vocabulary_)),
+        ('career_model_nonzeros', 'Stored entries in the TF-IDF matrix', state.tfidf_matrix.nnz),
+        ('career_model_version', 'Version of the active model state', state.version),
+        ('career_cache_entries', 'Entries in the result cache', cache_stats['size']),
+        ('career_cache_hits', 'Result cache hits', cache_stats['hits']),
+        ('career_cache_misses', 'Result cache misses', cache_stats['misses']),
+        ('career_metrics_sample_rate', 'Fraction of requests timed', metrics.sample_rate),
+    ]
+    
+    return Response(metrics.render(gauges), mimetype='text/plain; version=0.0.4')
+
 @api_bp.route('/health', methods=['GET'])
+@metrics.instrument('health')
 def health_check():
-    """Health check endpoint"""
-    return jsonify({
+    """Liveness check: the process is up, whether or not the model has loaded"""
+    response = {
         'status': 'healthy',
         'message': 'Career Recommender API is running',
-        'total_careers': len(recommender.career_data)
-    })
\ No newline at end of file
+        'model': engine_status()
+    }
+    if is_ready():
+        response['total_careers'] = len(recommender.catalog)
+        response['cache'] = recommender.cache.stats()
+    
+    return jsonify(response)
+
+@api_bp.route('/ready', methods=['GET'])
+def readiness_check():
+    """Readiness check: 200 once the model has loaded, 503 while it loads or if it failed"""
+    status = engine_status()
+    if status['state'] != 'ready':
+        return jsonify({'status': status['state'], 'model': status}), 503, {'Retry-After': '1'}
+    
+    return jsonify({'status': 'ready', 'model': status})
\ No newline at end of file
@@ -1,6 +1,7 @@
 from flask import Flask, send_from_directory
 from flask_cors import CORS
 import os
+from engine import start_engine
 from routes.api import api_bp
 
 # Initialize Flask app
@@ -12,6 +13,9 @@ CORS(app)
 # Register blueprints
 app.register_blueprint(api_bp, url_prefix='/api')
 
+# The recommender loads in the background from the first request, including the frontend's
+app.before_request(start_engine)
+
 @app.route('/')
 def serve_frontend():
     """Serve frontend index.html"""
@@ -34,11 +38,17 @@ if __name__ == '__main__':
     print("   ✅ REST API endpoints")
     print("   ✅ Career database with 8+ roles")
     print("\n🌐 API Endpoints:")
-    print("   • GET  /api/health          - Health check")
+    print("   • GET  /api/health          - Liveness check")
+    print("   • GET  /api/ready           - Readiness check (503 while the model loads)")
     print("   • GET  /api/careers         - Get all careers")
     print("   • GET  /api/career/<id>     - Get career details")
     print("   • POST /api/recommend       - Get recommendations")
+    print("   • POST /api/recommend/batch - Get recommendations for many profiles")
     print("   • POST /api/skill-gap       - Analyze skill gaps")
+    print("   • POST /api/skill-gap/top   - Analyze skill gaps for top careers")
+    print("   • POST /api/learning-plan   - Learning plan for target or top careers")
+    print("   • GET  /api/skills/<skill>/careers - Careers using a skill")
+    print("   • GET  /api/metrics         - Prometheus metrics")
     print("\n🔗 Frontend URL: http://localhost:5000")
     print("📁 Backend URL:  http://localhost:5000/api/health")
     print("\nPress Ctrl+C to stop the server")
@@ -0,0 +1,314 @@
+"""ASGI entry point with request coalescing for the scoring endpoints
+
+Serves the same POST /api/recommend and POST /api/skill-gap contracts as the
+Flask app, without any framework dependency. Run it with any ASGI server from
+the backend directory, e.g.:
+
+    uvicorn routes.asgi:app --port 5000
+
+Recommendation requests that arrive close together are coalesced into one
+micro-batch and scored with a single vectorizer call and sparse matrix product
+(CareerRecommender.recommend_careers_batch). A batch is scored as soon as it
+holds CAREER_BATCH_MAX_SIZE requests or CAREER_BATCH_MAX_WAIT_MS milliseconds
+have passed since its first request, whichever comes first. Scoring runs on a
+worker thread so the event loop keeps accepting requests, which then form the
+next batch. If a batch fails, its requests are scored again one by one, so an
+error reaches only the request that caused it.
+
+The recommender loads in the background from lifespan startup (or the first
+request, for servers without lifespan events), so the server accepts
+connections at once. GET /api/health answers as soon as the process
+is up; GET /api/ready and the scoring endpoints answer 503 until the model
+has loaded.
+"""
+import asyncio
+import functools
+import json
+import os
+import sys
+from typing import Any, Dict, List, Optional, Tuple
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Shared recommender, also served by the Flask apps in the same process; it loads in the background
+from engine import engine_status, is_ready, recommender, start_engine
+from ml_model import SCORERS, CareerRecommender, Recommendation
+
+# Upper bound on requests scored together, and on how long the first one waits for company
+MAX_BATCH_SIZE = int(os.environ.get("CAREER_BATCH_MAX_SIZE", 64))
+MAX_WAIT_MS = float(os.environ.get("CAREER_BATCH_MAX_WAIT_MS", 5))
+
+CORS_HEADERS = [
+    (b"access-control-allow-origin", b"*"),
+    (b"access-control-allow-methods", b"GET, POST, OPTIONS"),
+    (b"access-control-allow-headers", b"Content-Type"),
+]
+
+
+class MicroBatcher:
+    """Coalesce concurrent recommendation requests into batched scoring calls"""
+
+    def __init__(self, recommender: CareerRecommender, max_batch_size: int = MAX_BATCH_SIZE,
+                 max_wait_ms: float = MAX_WAIT_MS):
+        self.recommender = recommender
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_wait = max(0.0, max_wait_ms) / 1000
+        self.queue: Optional[asyncio.Queue] = None
+        self.task: Optional[asyncio.Task] = None
+        self.batches = 0
+        self.requests = 0
+
+    def start(self):
+        """Start the batching task on the running event loop"""
+        if self.task is None or self.task.done():
+            self.queue = asyncio.Queue()
+            self.task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self):
+        """Cancel the batching task"""
+        if self.task is not None:
+            self.task.cancel()
+            try:
+                await self.task
+            except asyncio.CancelledError:
+                pass
+            self.task = None
+
+    async def recommend(self, profile: Dict[str, Any], scorer: Optional[str] = None) -> List[Recommendation]:
+        """Recommendations for one profile, scored together with concurrent requests"""
+        self.start()
+        future = asyncio.get_running_loop().create_future()
+        await self.queue.put((profile, scorer, future))
+        return await future
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self.queue.get()]
+            deadline = loop.time() + self.max_wait
+            while len(batch) < self.max_batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self.queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            # Requests whose clients went away are dropped before scoring
+            groups: Dict[Optional[str], list] = {}
+            for profile, scorer, future in batch:
+                if not future.done():
+                    groups.setdefault(scorer, []).append((profile, future))
+
+            # Requests naming different scorers are scored as separate batches
+            for scorer, group in groups.items():
+                self.batches += 1
+                self.requests += len(group)
+                await self._score(loop, group, scorer)
+
+    async def _score(self, loop, group: list, scorer: Optional[str]):
+        try:
+            results = await loop.run_in_executor(
+                None, functools.partial(self.recommender.recommend_careers_batch,
+                                        [profile for profile, _ in group], scorer=scorer)
+            )
+        except Exception as e:
+            # Scored again one by one, so one client's bad input fails only its own request
+            if len(group) > 1:
+                for member in group:
+                    await self._score(loop, [member], scorer)
+                return
+            for _, future in group:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, future), recommendations in zip(group, results):
+            if not future.done():
+                future.set_result(recommendations)
+
+    def stats(self) -> Dict[str, Any]:
+        """Batching counters"""
+        return {
+            "batches": self.batches,
+            "requests": self.requests,
+            "mean_batch_size": round(self.requests / self.batches, 2) if self.batches else 0.0,
+            "max_batch_size": self.max_batch_size,
+            "max_wait_ms": self.max_wait * 1000
+        }
+
+
+batcher = MicroBatcher(recommender)
+
+
+def profile_error(data: Dict) -> Optional[str]:
+    """Why a recommendation request's profile fields cannot be scored, or None when they can"""
+    for field in ('skills', 'interests', 'education_level'):
+        if field in data and not isinstance(data[field], str):
+            return f'{field} must be a string'
+    experience_years = data.get('experience_years', 2)
+    if isinstance(experience_years, bool):
+        return 'experience_years must be an integer'
+    try:
+        int(experience_years)
+    except (TypeError, ValueError, OverflowError):
+        return 'experience_years must be an integer'
+    return None
+
+
+async def recommend_careers(data: Dict) -> Tuple[int, Dict]:
+    """Get career recommendations based on user profile"""
+    if not data.get('skills'):
+        return 400, {'error': 'Skills are required'}
+
+    error = profile_error(data)
+    if error:
+        return 400, {'error': error}
+
+    if data.get('scorer') is not None and data['scorer'] not in SCORERS:
+        return 400, {'error': f'Unknown scorer, expected one of {sorted(SCORERS)}'}
+
+    recommendations = await batcher.recommend({
+        'skills': data.get('skills', ''),
+        'interests': data.get('interests', ''),
+        'experience_years': int(data.get('experience_years', 2)),
+        'education_level': data.get('education_level', "Bachelor's")
+    }, scorer=data.get('scorer'))
+
+    return 200, {
+        'status': 'success',
+        'recommendations': [r.to_dict() for r in recommendations]
+    }
+
+
+async def analyze_skill_gap(data: Dict) -> Tuple[int, Dict]:
+    """Analyze skill gaps for a specific career"""
+    if not data.get('skills') or not data.get('target_career_id'):
+        return 400, {'error': 'Skills and target career ID are required'}
+
+    skills = [s.strip() for s in data['skills'].split(',')]
+
+    # Cache misses build a learning plan, so the analysis runs off the event loop like scoring
+    analysis = await asyncio.get_running_loop().run_in_executor(None, functools.partial(
+        recommender.get_skill_gap_analysis,
+        user_skills=skills,
+        target_career_id=int(data['target_career_id'])
+    ))
+
+    return 200, {
+        'status': 'success',
+        'analysis': analysis
+    }
+
+
+async def health_check(data: Dict) -> Tuple[int, Dict]:
+    """Liveness check: the process is up, whether or not the model has loaded"""
+    response = {
+        'status': 'healthy',
+        'message': 'Career Recommender API is running',
+        'model': engine_status(),
+        'batching': batcher.stats()
+    }
+    if is_ready():
+        response['total_careers'] = len(recommender.catalog)
+        response['cache'] = recommender.cache.stats()
+    return 200, response
+
+
+async def readiness_check(data: Dict) -> Tuple[int, Dict]:
+    """Readiness check: 200 once the model has loaded, 503 while it loads or if it failed"""
+    status = engine_status()
+    if status['state'] != 'ready':
+        return 503, {'status': status['state'], 'model': status}
+    return 200, {'status': 'ready', 'model': status}
+
+
+ROUTES = {
+    ('POST', '/api/recommend'): recommend_careers,
+    ('POST', '/api/skill-gap'): analyze_skill_gap,
+    ('GET', '/api/health'): health_check,
+    ('GET', '/api/ready'): readiness_check,
+}
+
+# Routes served while the model is still loading
+UNGATED_ROUTES = {health_check, readiness_check}
+
+
+async def read_body(receive) -> bytes:
+    """Full request body, possibly delivered over several messages"""
+    chunks = []
+    while True:
+        message = await receive()
+        if message['type'] == 'http.disconnect':
+            raise ConnectionError('Client disconnected')
+        chunks.append(message.get('body', b''))
+        if not message.get('more_body', False):
+            return b''.join(chunks)
+
+
+async def send_response(send, status: int, payload: Optional[Dict] = None):
+    body = json.dumps(payload).encode('utf-8') if payload is not None else b''
+    headers = [(b'content-length', str(len(body)).encode('ascii'))] + CORS_HEADERS
+    if payload is not None:
+        headers.append((b'content-type', b'application/json'))
+    if status == 503:
+        headers.append((b'retry-after', b'1'))
+    await send({'type': 'http.response.start', 'status': status, 'headers': headers})
+    await send({'type': 'http.response.body', 'body': body})
+
+
+async def lifespan(receive, send):
+    while True:
+        message = await receive()
+        if message['type'] == 'lifespan.startup':
+            start_engine()
+            batcher.start()
+            await send({'type': 'lifespan.startup.complete'})
+        elif message['type'] == 'lifespan.shutdown':
+            await batcher.stop()
+            await send({'type': 'lifespan.shutdown.complete'})
+            return
+
+
+async def app(scope, receive, send):
+    """ASGI application"""
+    if scope['type'] == 'lifespan':
+        return await lifespan(receive, send)
+    if scope['type'] != 'http':
+        return
+    start_engine()
+
+    method, path = scope['method'], scope['path'].rstrip('/') or '/'
+    if method == 'OPTIONS':
+        return await send_response(send, 204)
+
+    handler = ROUTES.get((method, path))
+    if handler is None:
+        if any(route_path == path for _, route_path in ROUTES):
+            return await send_response(send, 405, {'error': 'Method not allowed'})
+        return await send_response(send, 404, {'error': 'Not found'})
+
+    if handler not in UNGATED_ROUTES and not is_ready():
+        status = engine_status()
+        message = 'Recommender failed to load' if status['state'] == 'failed' else 'Recommender is loading, retry shortly'
+        return await send_response(send, 503, {'error': message, 'model': status})
+
+    try:
+        body = await read_body(receive)
+    except ConnectionError:
+        return
+
+    try:
+        data = json.loads(body) if body else {}
+        if not isinstance(data, dict):
+            raise ValueError('Expected a JSON object')
+    except ValueError:
+        return await send_response(send, 400, {'error': 'Invalid JSON body'})
+
+    try:
+        status, payload = await handler(data)
+    except Exception as e:
+        status, payload = 500, {'error': str(e)}
+
+    await send_response(send, status, payload)
@@ -0,0 +1,134 @@
+"""Bulk-score user profiles from newline-delimited JSON
+
+Reads one profile per line ({"id": ..., "skills": ..., "interests": ...,
+"experience_years": ..., "education_level": ...}) from a file or stdin and
+writes one result per line to stdout, in input order:
+
+    python -m backend.score profiles.ndjson > recommendations.ndjson
+    cat profiles.ndjson | python -m backend.score --workers 8 --chunk-size 2000
+
+Profiles are read and scored in chunks. Each chunk is vectorized as one batch
+on a pool of worker processes, and only a bounded number of chunks is in
+flight at a time, so memory stays flat regardless of input size. Every worker
+loads the fitted model once: from --model when given, otherwise from an
+artifact the parent fits and saves to a temporary directory before starting
+the pool.
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import IO, Iterator, List, Optional, Tuple
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from catalog import DEFAULT_CATALOG_PATH, load_catalog
+from ml_model import CareerRecommender
+
+# Recommender loaded once per worker process by init_worker
+_recommender: Optional[CareerRecommender] = None
+_top_k = 5
+
+
+def init_worker(catalog_path: str, model_path: str, top_k: int):
+    """Load the catalog and fitted model once per worker process"""
+    global _recommender, _top_k
+    _recommender = CareerRecommender(load_catalog(catalog_path), cache_size=0, model_path=model_path)
+    _top_k = top_k
+
+
+def score_chunk(chunk: List[Tuple[int, str]]) -> str:
+    """Score a chunk of (line number, raw line) pairs into NDJSON output"""
+    profiles, outputs = [], []
+    for line_number, line in chunk:
+        try:
+            profile = json.loads(line)
+            if not isinstance(profile, dict) or not profile.get("skills"):
+                raise ValueError("Skills are required")
+            for field in ("skills", "interests", "education_level"):
+                if field in profile and not isinstance(profile[field], str):
+                    raise TypeError(f"{field} must be a string")
+            experience_years = profile.get("experience_years", 2)
+            if isinstance(experience_years, bool) or not isinstance(experience_years, (int, float, str)):
+                raise TypeError("experience_years must be an integer")
+            profiles.append({
+                "skills": profile["skills"],
+                "interests": profile.get("interests", ""),
+                "experience_years": int(experience_years),
+                "education_level": profile.get("education_level", "Bachelor's")
+            })
+            outputs.append({"id": profile.get("id"), "line": line_number})
+        except (ValueError, TypeError, OverflowError) as e:
+            outputs.append({"line": line_number, "error": str(e)})
+
+    results = iter(_recommender.recommend_careers_batch(profiles, top_k=_top_k))
+    lines = []
+    for output in outputs:
+        if "error" not in output:
+            output["recommendations"] = [
+                {"id": r.career_id, "title": r.career["title"], "match_score": r.match_score}
+                for r in next(results)
+            ]
+        lines.append(json.dumps(output, ensure_ascii=False) + "\n")
+    return "".join(lines)
+
+
+def read_chunks(stream: IO[str], chunk_size: int) -> Iterator[List[Tuple[int, str]]]:
+    """Non-blank input lines, numbered from 1, in chunks of at most chunk_size"""
+    numbered = ((i, line) for i, line in enumerate(stream, start=1) if line.strip())
+    while True:
+        chunk = list(islice(numbered, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def run(stream: IO[str], out: IO[str], catalog_path: str, model_path: str, workers: int, chunk_size: int,
+        top_k: int):
+    """Score every profile in stream and write results to out in input order"""
+    if workers <= 1:
+        init_worker(catalog_path, model_path, top_k)
+        for chunk in read_chunks(stream, chunk_size):
+            out.write(score_chunk(chunk))
+        return
+
+    # At most two chunks per worker are queued or running, which bounds memory use
+    with ProcessPoolExecutor(max_workers=workers, initializer=init_worker,
+                             initargs=(catalog_path, model_path, top_k)) as pool:
+        pending = deque()
+        for chunk in read_chunks(stream, chunk_size):
+            pending.append(pool.submit(score_chunk, chunk))
+            if len(pending) >= workers * 2:
+                out.write(pending.popleft().result())
+        while pending:
+            out.write(pending.popleft().result())
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Bulk-score NDJSON user profiles")
+    parser.add_argument("input", nargs="?", default="-", help="NDJSON profiles file, or - for stdin")
+    parser.add_argument("--catalog", default=os.environ.get("CAREER_CATALOG_PATH", DEFAULT_CATALOG_PATH))
+    parser.add_argument("--model", default=os.environ.get("CAREER_MODEL_ARTIFACT", ""),
+                        help="model artifact fitted on the catalog")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--chunk-size", type=int, default=1000)
+    parser.add_argument("--top-k", type=int, default=5)
+    args = parser.parse_args()
+
+    stream = sys.stdin if args.input == "-" else open(args.input, encoding="utf-8")
+    with stream, tempfile.TemporaryDirectory() as tmp:
+        model_path = args.model
+        if not model_path:
+            # Fit once here so workers load a shared, memory-mapped artifact instead of each refitting
+            model_path = os.path.join(tmp, "model")
+            CareerRecommender(load_catalog(args.catalog), cache_size=0, model_path="").save_artifact(model_path)
+
+        run(stream, sys.stdout, args.catalog, model_path, args.workers, args.chunk_size, args.top_k)
+
+
+if __name__ == "__main__":
+    main()
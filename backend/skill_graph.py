@@ -0,0 +1,236 @@
+"""Skill prerequisite graph and learning-plan planner
+
+data/skill_graph.json (or CAREER_SKILL_GRAPH_PATH) gives each canonical skill
+an effort estimate in weeks and the skills it requires first. The graph is
+loaded once into compact arrays: effort per skill, prerequisites as CSR
+arrays, and each skill's depth (the length of its longest prerequisite
+chain). Cycles are rejected at load time.
+
+A plan covers the missing skills of one or several goals (target careers)
+plus every prerequisite the user does not already have. Knowing a skill is
+taken to mean knowing its prerequisites too. Each skill's transitive
+prerequisite set is computed once, memoized as an integer bitmask, so a plan
+is a handful of bitwise ORs whatever the vocabulary size. Steps are ordered
+by depth, which is a topological order, so every skill comes after its
+prerequisites. Skills the graph does not know take the default effort and
+have no prerequisites.
+"""
+import json
+import os
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+DEFAULT_GRAPH_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "skill_graph.json")
+
+
+def load_skill_graph(path: str = DEFAULT_GRAPH_PATH) -> "SkillGraph":
+    """Skill graph from a JSON file"""
+    with open(path, encoding="utf-8") as f:
+        return SkillGraph.from_dict(json.load(f))
+
+
+def time_to_proficiency(effort_weeks: float) -> str:
+    """Human-readable estimate for a number of weeks of learning"""
+    if effort_weeks <= 12:
+        return "1-3 months"
+    elif effort_weeks <= 26:
+        return "3-6 months"
+    elif effort_weeks <= 52:
+        return "6-12 months"
+    else:
+        return "1-2 years"
+
+
+def bits(mask: int) -> List[int]:
+    """Positions of the set bits of a bitmask, lowest first"""
+    if not mask:
+        return []
+    raw = np.frombuffer(mask.to_bytes((mask.bit_length() + 7) // 8, "little"), dtype=np.uint8)
+    return np.flatnonzero(np.unpackbits(raw, bitorder="little")).tolist()
+
+
+class SkillGraph:
+    """Prerequisite DAG over skills with an effort estimate per skill"""
+
+    def __init__(self, skills: List[str], effort_weeks: np.ndarray, prerequisite_indptr: np.ndarray,
+                 prerequisite_indices: np.ndarray, default_effort_weeks: float = 4.0):
+        self.skills = skills
+        self.skill_lookup = {skill: i for i, skill in enumerate(skills)}
+        self.effort_weeks = effort_weeks
+        self.prerequisite_indptr = prerequisite_indptr
+        self.prerequisite_indices = prerequisite_indices
+        self.default_effort_weeks = default_effort_weeks
+        self.depth = self._depths()
+
+        # Plain-list views of the arrays for the per-step loops, where NumPy scalars cost more than they save
+        self._efforts: List[float] = effort_weeks.tolist()
+        self._depth_list: List[int] = self.depth.tolist()
+        self._prerequisite_lists: List[List[int]] = [
+            prerequisite_indices[start:end].tolist()
+            for start, end in zip(prerequisite_indptr[:-1].tolist(), prerequisite_indptr[1:].tolist())
+        ]
+
+        # Transitive prerequisites (the skill included) as bitmasks, filled in on first use
+        self._closures: List[Optional[int]] = [None] * len(skills)
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "SkillGraph":
+        """Compile {"default_effort_weeks": w, "skills": {skill: {"effort_weeks": w, "requires": [...]}}}"""
+        default_effort = float(data.get("default_effort_weeks", 4.0))
+        entries = {skill.lower().strip(): entry for skill, entry in data["skills"].items()}
+
+        # Prerequisites without an entry of their own are skills too
+        skills = list(entries)
+        for entry in list(entries.values()):
+            for prerequisite in entry.get("requires", []):
+                if prerequisite.lower().strip() not in entries:
+                    entries[prerequisite.lower().strip()] = {}
+                    skills.append(prerequisite.lower().strip())
+        lookup = {skill: i for i, skill in enumerate(skills)}
+
+        effort = np.array([entries[skill].get("effort_weeks", default_effort) for skill in skills], dtype=np.float32)
+        indptr, indices = [0], []
+        for skill in skills:
+            indices.extend(dict.fromkeys(lookup[p.lower().strip()] for p in entries[skill].get("requires", [])))
+            indptr.append(len(indices))
+
+        return cls(skills, effort, np.array(indptr, dtype=np.int32), np.array(indices, dtype=np.int32),
+                   default_effort)
+
+    def __len__(self) -> int:
+        return len(self.skills)
+
+    def __contains__(self, skill: str) -> bool:
+        return skill in self.skill_lookup
+
+    def prerequisites(self, skill_id: int) -> np.ndarray:
+        """Ids of the skills directly required before a skill"""
+        return self.prerequisite_indices[self.prerequisite_indptr[skill_id]:self.prerequisite_indptr[skill_id + 1]]
+
+    def _depths(self) -> np.ndarray:
+        """Longest prerequisite chain below every skill, by Kahn's algorithm; raises ValueError on a cycle"""
+        n = len(self.skills)
+        dependents: List[List[int]] = [[] for _ in range(n)]
+        pending = np.diff(self.prerequisite_indptr).astype(np.int32)
+        for skill_id in range(n):
+            for prerequisite in self.prerequisites(skill_id):
+                dependents[prerequisite].append(skill_id)
+
+        depth = np.zeros(n, dtype=np.int32)
+        ready = [i for i in range(n) if pending[i] == 0]
+        visited = 0
+        while ready:
+            skill_id = ready.pop()
+            visited += 1
+            for dependent in dependents[skill_id]:
+                depth[dependent] = max(depth[dependent], depth[skill_id] + 1)
+                pending[dependent] -= 1
+                if pending[dependent] == 0:
+                    ready.append(dependent)
+
+        if visited < n:
+            cycle = sorted(self.skills[i] for i in np.flatnonzero(pending))
+            raise ValueError(f"Skill prerequisites form a cycle among {cycle}")
+        return depth
+
+    def closure(self, skill_id: int) -> int:
+        """Bitmask of a skill and all of its transitive prerequisites"""
+        if self._closures[skill_id] is None:
+            # Depth-first with an explicit stack, so long prerequisite chains cannot exhaust the recursion limit
+            stack = [skill_id]
+            while stack:
+                current = stack[-1]
+                pending = [p for p in self._prerequisite_lists[current] if self._closures[p] is None]
+                if pending:
+                    stack.extend(pending)
+                    continue
+                stack.pop()
+                mask = 1 << current
+                for prerequisite in self._prerequisite_lists[current]:
+                    mask |= self._closures[prerequisite]
+                self._closures[current] = mask
+        return self._closures[skill_id]
+
+    def known_mask(self, skills: Iterable[str]) -> int:
+        """Bitmask of skills a user has, including everything they presuppose"""
+        mask = 0
+        for skill in skills:
+            skill_id = self.skill_lookup.get(skill)
+            if skill_id is not None:
+                mask |= self.closure(skill_id)
+        return mask
+
+    def _goal(self, missing: Iterable[str], known: int) -> Tuple[int, List[str]]:
+        """Bitmask of graph skills to learn for a goal, and the goal's skills the graph does not know"""
+        mask, unknown = 0, []
+        for skill in missing:
+            skill_id = self.skill_lookup.get(skill)
+            if skill_id is None:
+                unknown.append(skill)
+            else:
+                # A missing skill is always learned, even when a known skill presupposes it
+                mask |= (1 << skill_id) | (self.closure(skill_id) & ~known)
+        return mask, unknown
+
+    def plan(self, goals: Dict, known_skills: Iterable[str]) -> Dict:
+        """Ordered, deduplicated learning plan covering the missing skills of every goal
+
+        goals maps a goal key (e.g. a career id) to the skills it is missing.
+        Each step lists its effort, its prerequisites within the plan and the
+        goals that need it. critical_path_weeks is the longest chain of
+        prerequisite efforts, the shortest time when unrelated skills are
+        learned in parallel.
+        """
+        known = self.known_mask(known_skills)
+        goal_masks = {key: self._goal(missing, known) for key, missing in goals.items()}
+
+        plan_mask = 0
+        for mask, _ in goal_masks.values():
+            plan_mask |= mask
+        planned = bits(plan_mask)
+
+        # Skills the graph does not know have no prerequisites, so they can start right away
+        needed_for: Dict[str, List] = {}
+        for key, (mask, unknown) in goal_masks.items():
+            for skill in unknown:
+                needed_for.setdefault(skill, []).append(key)
+        steps = [
+            {"skill": skill, "effort_weeks": self.default_effort_weeks, "prerequisites": [], "needed_for": keys}
+            for skill, keys in sorted(needed_for.items())
+        ]
+        critical_path_weeks = self.default_effort_weeks if steps else 0.0
+
+        # Depth order is topological, so a step's prerequisites finish before it starts
+        depth, efforts, skills = self._depth_list, self._efforts, self.skills
+        finish: Dict[int, float] = {}
+        for skill_id in sorted(planned, key=lambda i: (depth[i], skills[i])):
+            prerequisites, start = [], 0.0
+            for prerequisite in self._prerequisite_lists[skill_id]:
+                if prerequisite in finish:
+                    prerequisites.append(skills[prerequisite])
+                    start = max(start, finish[prerequisite])
+            finish[skill_id] = start + efforts[skill_id]
+            critical_path_weeks = max(critical_path_weeks, finish[skill_id])
+            steps.append({
+                "skill": skills[skill_id],
+                "effort_weeks": efforts[skill_id],
+                "prerequisites": prerequisites,
+                "needed_for": [key for key, (mask, _) in goal_masks.items() if mask >> skill_id & 1],
+            })
+
+        effort_weeks = sum(step["effort_weeks"] for step in steps)
+        return {
+            "steps": steps,
+            "effort_weeks": effort_weeks,
+            "critical_path_weeks": critical_path_weeks,
+            "time_to_proficiency": time_to_proficiency(effort_weeks),
+            "goals": {
+                key: {"effort_weeks": self.mask_effort(mask) + len(unknown) * self.default_effort_weeks}
+                for key, (mask, unknown) in goal_masks.items()
+            },
+        }
+
+    def mask_effort(self, mask: int) -> float:
+        """Total effort of the skills in a bitmask"""
+        return sum(self._efforts[i] for i in bits(mask))
@@ -0,0 +1,175 @@
+"""Skill alias normalization
+
+Maps free-text skills onto the canonical vocabulary, so "ML, Py, k8s, postgres"
+matches careers listing "machine learning", "python", "kubernetes" and "sql".
+The alias table (data/skill_aliases.json, or CAREER_SKILL_ALIASES_PATH) maps
+each canonical skill to its aliases. It is compiled once into a word-level
+trie. The catalog's own skill names are added to the trie too, so they are
+recognized inside longer text.
+
+Input is split on commas, semicolons and newlines, as before. An item that is
+exactly a known name maps straight to its canonical skill. Any other item is
+scanned once, left to right, taking the longest known phrase at each position,
+so a pasted résumé paragraph is normalized in a single linear pass. Short
+items containing no known phrase (at most MAX_UNKNOWN_SKILL_WORDS words) are
+kept as typed (lowercased), which is how every skill was matched before;
+longer ones are prose and are dropped. Results are memoized per distinct
+input.
+
+Canonical skills drive overlap scoring and skill gaps. TF-IDF scoring also
+needs the words around them ("algorithms" in "machine learning algorithms"),
+which still match career descriptions. profile_text therefore vectorizes the
+skills as typed, adding only the canonical names of aliases ("ml" also reads
+as "machine learning").
+"""
+import json
+import os
+import re
+import threading
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+from cache import TTLCache
+
+DEFAULT_ALIASES_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "skill_aliases.json")
+
+# Words keep the punctuation skills use inside names: c++, c#, node.js, ci/cd, multi-cloud
+TOKEN_PATTERN = re.compile(r"[a-z0-9+#](?:[a-z0-9+#./-]*[a-z0-9+#])?")
+ITEM_SEPARATORS = re.compile(r"[,;\n]")
+
+# Longest item kept as a skill of its own when it contains no known phrase
+MAX_UNKNOWN_SKILL_WORDS = 3
+
+# Trie key marking the end of a known phrase; never a token since tokens are non-empty
+_END = ""
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercased words of a skill name or free text"""
+    return TOKEN_PATTERN.findall(text.lower())
+
+
+def profile_text(skills: Union[str, Iterable[str]], canonical: Iterable[str], interests: str) -> str:
+    """Text a profile is vectorized from: its skills as typed, canonical names they do not spell out, its interests
+
+    Skill words are sorted, which a bag-of-words vector cannot tell, so reordered skills share cache entries.
+    """
+    words = tokenize(skills if isinstance(skills, str) else " ".join(skills))
+    typed = set(words)
+    for skill in canonical:
+        skill_words = tokenize(skill)
+        if not typed.issuperset(skill_words):
+            words.extend(skill_words)
+    return " ".join(sorted(words) + interests.lower().split())
+
+
+def load_aliases(path: str = DEFAULT_ALIASES_PATH) -> Dict[str, List[str]]:
+    """Canonical skill -> aliases table"""
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+class SkillNormalizer:
+    """Compiled alias matcher turning free-text skills into canonical ones"""
+
+    def __init__(self, aliases: Optional[Dict[str, List[str]]] = None, skills: Iterable[str] = (),
+                 memo_size: int = 4096):
+        if aliases is None:
+            aliases = load_aliases(os.environ.get("CAREER_SKILL_ALIASES_PATH", DEFAULT_ALIASES_PATH))
+        self._trie: Dict = {}
+        self._known_skills = set()
+        self._lock = threading.Lock()
+        self._memo = TTLCache(max_entries=memo_size, ttl=float("inf"))
+
+        for canonical, names in aliases.items():
+            canonical = canonical.lower().strip()
+            for name in [canonical, *names]:
+                self._insert(name, canonical)
+        self.add_skills(skills)
+
+    def __getstate__(self):
+        state = dict(self.__dict__)
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def _insert(self, name: str, canonical: str, overwrite: bool = True):
+        node = self._trie
+        for token in tokenize(name):
+            node = node.setdefault(token, {})
+        if node is not self._trie and (overwrite or _END not in node):
+            node[_END] = canonical
+
+    def add_skills(self, skills: Iterable[str]):
+        """Recognize catalog skill names as themselves, unless an alias already claims them"""
+        with self._lock:
+            added = False
+            for skill in skills:
+                if skill in self._known_skills:
+                    continue
+                self._known_skills.add(skill)
+                skill = skill.lower().strip()
+                node = self._lookup(tokenize(skill))
+                if node is None or _END not in node:
+                    self._insert(skill, skill, overwrite=False)
+                    added = True
+            if added:
+                self._memo.clear()
+
+    def _lookup(self, tokens: List[str]) -> Optional[Dict]:
+        node = self._trie
+        for token in tokens:
+            node = node.get(token)
+            if node is None:
+                return None
+        return node
+
+    def scan(self, tokens: List[str]) -> List[str]:
+        """Canonical skills of the longest known phrases, scanning tokens left to right"""
+        found = []
+        i, n = 0, len(tokens)
+        while i < n:
+            node = self._trie
+            match, end = None, i
+            j = i
+            while j < n:
+                node = node.get(tokens[j])
+                if node is None:
+                    break
+                j += 1
+                if _END in node:
+                    match, end = node[_END], j
+            if match is None:
+                i += 1
+            else:
+                found.append(match)
+                i = end
+        return found
+
+    def normalize(self, skills: Union[str, Iterable[str]]) -> Tuple[str, ...]:
+        """Canonical, deduplicated, sorted skills from a comma-separated string, free text or a list"""
+        key = skills if isinstance(skills, str) else tuple(skills)
+        cached = self._memo.get(key)
+        if cached is not None:
+            return cached
+
+        items = ITEM_SEPARATORS.split(skills) if isinstance(skills, str) else key
+        normalized = set()
+        for item in items:
+            tokens = tokenize(item)
+            node = self._lookup(tokens) if tokens else None
+            if node is not None and _END in node:
+                normalized.add(node[_END])
+                continue
+
+            found = self.scan(tokens)
+            if found:
+                normalized.update(found)
+            elif len(tokens) <= MAX_UNKNOWN_SKILL_WORDS:
+                normalized.add(item.lower().strip())
+
+        result = tuple(sorted(normalized - {""}))
+        self._memo.put(key, result)
+        return result
@@ -14,6 +14,18 @@ document.addEventListener('DOMContentLoaded', function() {
     loadCareers();
 });
 
+// Fetch, retrying while the backend answers 503 because the model is still loading
+async function fetchWhenReady(url, options, attempts = 30) {
+    const response = await fetch(url, options);
+    if (response.status !== 503 || attempts <= 1) {
+        return response;
+    }
+    
+    const retryAfter = parseFloat(response.headers.get('Retry-After')) || 1;
+    await new Promise(resolve => setTimeout(resolve, retryAfter * 1000));
+    return fetchWhenReady(url, options, attempts - 1);
+}
+
 // Get recommendations
 async function getRecommendations() {
     const loading = document.getElementById('loading');
@@ -21,7 +33,7 @@ async function getRecommendations() {
     resultsContainer.innerHTML = '';
     
     try {
-        const response = await fetch(`${API_BASE}/recommend`, {
+        const response = await fetchWhenReady(`${API_BASE}/recommend`, {
             method: 'POST',
             headers: {
                 'Content-Type': 'application/json',
@@ -82,7 +94,7 @@ function displayRecommendations(recommendations) {
 // Load all careers
 async function loadCareers() {
     try {
-        const response = await fetch(`${API_BASE}/careers`);
+        const response = await fetchWhenReady(`${API_BASE}/careers`);
         const data = await response.json();
         
         if (data.status === 'success') {